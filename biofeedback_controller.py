@@ -1,7 +1,5 @@
-import threading
-import json
+import asyncio
 import logging
-import time
 from typing import Dict, List, Tuple
 from enum import Enum
 from dataclasses import dataclass
@@ -9,6 +7,8 @@ from dataclasses import dataclass
 # Constants and configuration
 CONFIG_FILE = 'config.json'
 LOG_FILE = 'biofeedback_controller.log'
+DEFAULT_VELOCITY_THRESHOLD = 0.5
+DEFAULT_FLOW_THRESHOLD = 0.5
 
 # Logging setup
 logging.basicConfig(filename=LOG_FILE, level=logging.DEBUG, format='%(asctime)s - %(levelname)s - %(message)s')
@@ -18,9 +18,9 @@ class AdaptationSignal(Enum):
     VELOCITY_THRESHOLD = 1
     FLOW_THEORY = 2
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class UserState:
-    """User state data structure"""
+    """Immutable user state snapshot"""
     velocity: float
     flow: float
     adaptation_signal: AdaptationSignal
@@ -29,10 +29,41 @@ class BiofeedbackController:
     """Real-time biofeedback loop controller for XR environment adaptation"""
     def __init__(self, config: Dict):
         self.config = config
+        # Missing thresholds (e.g. no config file) fall back to the defaults
+        for key in ('velocity_threshold', 'flow_threshold'):
+            if key not in config:
+                logging.warning(f'No {key} configured, using the default')
+        self.velocity_threshold = float(config.get('velocity_threshold', DEFAULT_VELOCITY_THRESHOLD))
+        self.flow_threshold = float(config.get('flow_threshold', DEFAULT_FLOW_THRESHOLD))
+        # Replaced wholesale by process_feedback (the single writer); readers take no lock
         self.user_state = UserState(0.0, 0.0, AdaptationSignal.VELOCITY_THRESHOLD)
-        self.lock = threading.Lock()
+        # Set when a new user state is published, to wake the monitor
+        self._dirty_event = asyncio.Event()
+        self._stopped = False
 
-    def process_feedback(self, feedback_data: Dict) -> None:
+    def select_adaptation_signal(self, velocity: float, flow: float) -> AdaptationSignal:
+        """
+        Select the adaptation signal for the given velocity and flow
+
+        Flow theory takes precedence over velocity-threshold identification; if
+        neither threshold is exceeded the current signal is kept.
+
+        Args:
+        velocity (float): Current eye velocity
+        flow (float): Current flow value
+
+        Returns:
+        AdaptationSignal: The adaptation signal to apply
+        """
+        index = (flow > self.flow_threshold) << 1 | (velocity > self.velocity_threshold)
+        return (
+            self.user_state.adaptation_signal,
+            AdaptationSignal.VELOCITY_THRESHOLD,
+            AdaptationSignal.FLOW_THEORY,
+            AdaptationSignal.FLOW_THEORY,
+        )[index]
+
+    async def process_feedback(self, feedback_data: Dict) -> None:
         """
         Process feedback data from the XR environment
 
@@ -49,20 +80,15 @@ class BiofeedbackController:
             velocity = feedback_data.get('velocity', 0.0)
             flow = feedback_data.get('flow', 0.0)
 
-            # Update user state
-            with self.lock:
-                self.user_state.velocity = velocity
-                self.user_state.flow = flow
-
-            # Apply velocity-threshold identification algorithm
-            if velocity > self.config['velocity_threshold']:
-                self.user_state.adaptation_signal = AdaptationSignal.VELOCITY_THRESHOLD
+            # Apply velocity-threshold identification and flow theory algorithms,
+            # then publish the new state snapshot with a single reference store
+            adaptation_signal = self.select_adaptation_signal(velocity, flow)
+            self.user_state = UserState(velocity, flow, adaptation_signal)
 
-            # Apply flow theory algorithm
-            if flow > self.config['flow_threshold']:
-                self.user_state.adaptation_signal = AdaptationSignal.FLOW_THEORY
+            # Wake the monitor
+            self._dirty_event.set()
 
-            logging.info(f'Processed feedback data: velocity={velocity}, flow={flow}, adaptation_signal={self.user_state.adaptation_signal}')
+            logging.info(f'Processed feedback data: velocity={velocity}, flow={flow}, adaptation_signal={adaptation_signal}')
 
         except Exception as e:
             logging.error(f'Error processing feedback data: {str(e)}')
@@ -73,8 +99,7 @@ class BiofeedbackController:
         """
         try:
             # Get current user state
-            with self.lock:
-                adaptation_signal = self.user_state.adaptation_signal
+            adaptation_signal = self.user_state.adaptation_signal
 
             # Send adaptation signal to XR environment
             if adaptation_signal == AdaptationSignal.VELOCITY_THRESHOLD:
@@ -87,47 +112,44 @@ class BiofeedbackController:
         except Exception as e:
             logging.error(f'Error sending adaptation signals: {str(e)}')
 
-    def monitor_user_state(self) -> None:
+    async def monitor_user_state(self) -> None:
         """
-        Monitor user state and update adaptation signals as needed
+        Monitor user state and send adaptation signals whenever it changes, until stopped
         """
         try:
-            while True:
-                # Get current user state
-                with self.lock:
-                    velocity = self.user_state.velocity
-                    flow = self.user_state.flow
-
-                # Apply velocity-threshold identification algorithm
-                if velocity > self.config['velocity_threshold']:
-                    self.user_state.adaptation_signal = AdaptationSignal.VELOCITY_THRESHOLD
-
-                # Apply flow theory algorithm
-                if flow > self.config['flow_threshold']:
-                    self.user_state.adaptation_signal = AdaptationSignal.FLOW_THEORY
+            while not self._stopped:
+                # Wait until process_feedback publishes a new user state
+                await self._dirty_event.wait()
+                self._dirty_event.clear()
+                if self._stopped:
+                    break
 
                 # Send adaptation signals to XR environment
                 self.send_adaptation_signals()
 
-                # Sleep for a short duration to avoid excessive CPU usage
-                time.sleep(0.1)
-
         except Exception as e:
             logging.error(f'Error monitoring user state: {str(e)}')
 
+    def stop(self) -> None:
+        """
+        Stop monitoring user state
+        """
+        self._stopped = True
+        self._dirty_event.set()
+
 def load_config() -> Dict:
     """
     Load configuration from file
     """
+    # Imported here so config_manager's logging setup doesn't preempt this module's log file
+    from config_manager import ConfigManager
     try:
-        with open(CONFIG_FILE, 'r') as f:
-            config = json.load(f)
-            return config
+        return ConfigManager.read_config_file(CONFIG_FILE)
     except Exception as e:
         logging.error(f'Error loading configuration: {str(e)}')
         return {}
 
-def main() -> None:
+async def run() -> None:
     # Load configuration
     config = load_config()
 
@@ -135,12 +157,19 @@ def main() -> None:
     biofeedback_controller = BiofeedbackController(config)
 
     # Start monitoring user state
-    monitoring_thread = threading.Thread(target=biofeedback_controller.monitor_user_state)
-    monitoring_thread.start()
+    monitoring_task = asyncio.create_task(biofeedback_controller.monitor_user_state())
 
     # Simulate feedback data
     feedback_data = {'velocity': 10.0, 'flow': 5.0}
-    biofeedback_controller.process_feedback(feedback_data)
+    await biofeedback_controller.process_feedback(feedback_data)
+
+    # Let the monitor react, then shut it down
+    await asyncio.sleep(0)
+    biofeedback_controller.stop()
+    await monitoring_task
+
+def main() -> None:
+    asyncio.run(run())
 
 if __name__ == '__main__':
     main()
\ No newline at end of file
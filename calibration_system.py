@@ -1,10 +1,9 @@
 import logging
 import numpy as np
-from typing import Tuple, List
+from typing import Tuple
 from sranipal_api import SRanipal_Eye
 import threading
 from enum import Enum
-from dataclasses import dataclass
 from abc import ABC, abstractmethod
 
 # Constants
@@ -22,12 +21,6 @@ class CalibrationStatus(Enum):
     CALIBRATING = 2
     CALIBRATED = 3
 
-@dataclass
-class CalibrationPoint:
-    """Dataclass for calibration point"""
-    x: int
-    y: int
-
 class CalibrationException(Exception):
     """Exception class for calibration errors"""
     pass
@@ -36,7 +29,7 @@ class CalibrationSystem(ABC):
     """Abstract base class for calibration system"""
     def __init__(self):
         self.calibration_status = CalibrationStatus.NOT_CALIBRATED
-        self.calibration_points = []
+        self.calibration_points = np.empty((0, 2), dtype=np.int32)
         self.ipd = 0
         self.lock = threading.Lock()
 
@@ -67,12 +60,19 @@ class EyeCalibrationSystem(CalibrationSystem):
             logger.info("Starting calibration process")
             self.calibration_status = CalibrationStatus.CALIBRATING
             self.eye.start_calibration()
-            for i in range(CALIBRATION_POINTS):
-                logger.info(f"Calibrating point {i+1} of {CALIBRATION_POINTS}")
-                point = self.eye.get_calibration_point()
-                self.calibration_points.append(CalibrationPoint(point[0], point[1]))
-                self.eye.move_to_next_calibration_point()
+            if hasattr(self.eye, "run_calibration_collect"):
+                # Collect every point in one SDK call instead of two calls per point
+                logger.info(f"Calibrating {CALIBRATION_POINTS} points")
+                points = np.asarray(self.eye.run_calibration_collect(CALIBRATION_POINTS), dtype=np.int32).reshape(CALIBRATION_POINTS, 2)
+            else:
+                points = np.empty((CALIBRATION_POINTS, 2), dtype=np.int32)
+                for i in range(CALIBRATION_POINTS):
+                    logger.info(f"Calibrating point {i+1} of {CALIBRATION_POINTS}")
+                    point = self.eye.get_calibration_point()
+                    points[i] = point[0], point[1]
+                    self.eye.move_to_next_calibration_point()
             self.eye.end_calibration()
+            self.calibration_points = points
             self.calibration_status = CalibrationStatus.CALIBRATED
             logger.info("Calibration process completed")
         except Exception as e:
@@ -86,10 +86,13 @@ class EyeCalibrationSystem(CalibrationSystem):
             if len(self.calibration_points) != CALIBRATION_POINTS:
                 logger.error("Invalid number of calibration points")
                 return False
-            for point in self.calibration_points:
-                if point.x < 0 or point.x > self.eye.get_screen_width() or point.y < 0 or point.y > self.eye.get_screen_height():
-                    logger.error("Calibration point out of bounds")
-                    return False
+            points = self.calibration_points
+            width = self.eye.get_screen_width()
+            height = self.eye.get_screen_height()
+            in_bounds = (points[:, 0] >= 0) & (points[:, 0] <= width) & (points[:, 1] >= 0) & (points[:, 1] <= height)
+            if not in_bounds.all():
+                logger.error("Calibration point out of bounds")
+                return False
             logger.info("Calibration validated")
             return True
         except Exception as e:
@@ -112,7 +115,7 @@ class EyeCalibrationSystem(CalibrationSystem):
 
 class CalibrationConfig:
     """Class for calibration configuration"""
-    def __init__(self, calibration_points: List[CalibrationPoint], ipd: float):
+    def __init__(self, calibration_points: np.ndarray, ipd: float):
         self.calibration_points = calibration_points
         self.ipd = ipd
 
@@ -1,12 +1,138 @@
+import copy
 import json
 import logging
+import mmap
 import os
-from typing import Dict, Any
+import threading
+from typing import Dict, Any, Optional, Tuple
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 # Set up logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+def _loads(raw: memoryview) -> Any:
+    """Parse JSON from a bytes-like buffer, using orjson (zero-copy) when it is installed"""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(bytes(raw))
+
+def _dumps(obj: Any) -> bytes:
+    """Serialize to indented JSON bytes, using orjson when it is installed"""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2).encode("utf-8")
+
+# Required configuration parameters: nested dicts are sections, tuples are (type, minimum, maximum)
+CONFIG_SCHEMA = {
+    "eye_tracking": {
+        "velocity_threshold": (float, 0, 1),
+        "saccade_detection": {
+            "threshold": (float, 0, 1),
+            "min_duration": (int, 0, None),
+            "max_duration": (int, 0, None)
+        },
+        "fixation_detection": {
+            "threshold": (float, 0, 1),
+            "min_duration": (int, 0, None),
+            "max_duration": (int, 0, None)
+        }
+    }
+}
+
+def _validate_section(schema: Dict[str, Any], section: Dict[str, Any]) -> None:
+    """
+    Validate a configuration section against its schema in a single traversal.
+
+    Args:
+        schema (Dict[str, Any]): The schema for the section.
+        section (Dict[str, Any]): The configuration section to validate.
+
+    Raises:
+        ValueError: If a parameter is missing, has the wrong type, or is out of range.
+    """
+    if not isinstance(section, dict):
+        raise ValueError(f"Invalid parameter value: expected a section, got {type(section).__name__}")
+    for param, rule in schema.items():
+        if param not in section:
+            raise ValueError(f"Missing required parameter: {param}")
+        value = section[param]
+        if isinstance(rule, dict):
+            _validate_section(rule, value)
+            continue
+        cast, minimum, maximum = rule
+        try:
+            value = cast(value)
+        except (TypeError, ValueError) as e:
+            raise ValueError(f"Invalid parameter value: {e}")
+        if minimum is not None and value < minimum:
+            raise ValueError(f"Invalid parameter value: {param} must be at least {minimum}")
+        if maximum is not None and value > maximum:
+            raise ValueError(f"Invalid parameter value: {param} must be at most {maximum}")
+
+class _ConfigFile:
+    """
+    A JSON configuration file shared by every reader in the process.
+
+    The file is memory-mapped and parsed only when its modification time, size or
+    inode changes; otherwise the previously parsed configuration is reused.
+    """
+
+    _instances: Dict[str, "_ConfigFile"] = {}
+    _lock = threading.Lock()
+
+    def __init__(self, path: str):
+        self.path = path
+        # (st_mtime_ns, st_size, st_ino) of the parsed contents; size and inode catch
+        # rewrites within the filesystem's timestamp granularity and atomic replaces
+        self._key: Optional[Tuple[int, int, int]] = None
+        self._parsed: Any = None
+
+    @classmethod
+    def get(cls, path: str) -> Any:
+        """
+        Get the parsed contents of a configuration file.
+
+        Args:
+            path (str): The path to the configuration file.
+
+        Returns:
+            Any: The parsed configuration, shared between callers.
+
+        Raises:
+            FileNotFoundError: If the file does not exist.
+            json.JSONDecodeError: If the file is not valid JSON.
+        """
+        with cls._lock:
+            config_file = cls._instances.get(path)
+            if config_file is None:
+                config_file = cls._instances[path] = cls(path)
+            return config_file._refresh()
+
+    def _refresh(self) -> Any:
+        """Re-parse the file if it changed since the last parse"""
+        fd = os.open(self.path, os.O_RDONLY)
+        try:
+            stat = os.fstat(fd)
+            key = (stat.st_mtime_ns, stat.st_size, stat.st_ino)
+            if key != self._key:
+                if stat.st_size == 0:
+                    # Empty files cannot be mapped; let the parser report them
+                    self._parsed = _loads(memoryview(b""))
+                else:
+                    # The mapping is only held while parsing, so a later truncation can't fault a reader
+                    with mmap.mmap(fd, 0, access=mmap.ACCESS_READ) as mm:
+                        with memoryview(mm) as view:
+                            self._parsed = _loads(view)
+                self._key = key
+            return self._parsed
+        finally:
+            os.close(fd)
+
 class ConfigManager:
     """
     Configuration manager for eye tracking parameters and thresholds.
@@ -30,8 +156,7 @@ class ConfigManager:
             Dict[str, Any]: The loaded configuration.
         """
         try:
-            with open(self.config_file, "r") as f:
-                config = json.load(f)
+            config = self.read_config_file(self.config_file)
             logger.info("Loaded configuration from file.")
             return config
         except FileNotFoundError:
@@ -41,6 +166,23 @@ class ConfigManager:
             logger.error(f"Failed to load configuration: {e}")
             raise
 
+    @classmethod
+    def read_config_file(cls, config_file: str) -> Dict[str, Any]:
+        """
+        Read a JSON configuration file, reusing the parsed result while the file is unchanged.
+
+        Args:
+            config_file (str): The path to the configuration file.
+
+        Returns:
+            Dict[str, Any]: A copy of the parsed configuration.
+
+        Raises:
+            FileNotFoundError: If the file does not exist.
+            json.JSONDecodeError: If the file is not valid JSON.
+        """
+        return copy.deepcopy(_ConfigFile.get(config_file))
+
     def create_default_config(self) -> Dict[str, Any]:
         """
         Create a default configuration.
@@ -74,8 +216,8 @@ class ConfigManager:
             config (Dict[str, Any]): The configuration to save.
         """
         try:
-            with open(self.config_file, "w") as f:
-                json.dump(config, f, indent=4)
+            with open(self.config_file, "wb") as f:
+                f.write(_dumps(config))
             logger.info("Saved configuration to file.")
         except Exception as e:
             logger.error(f"Failed to save configuration: {e}")
@@ -86,50 +228,16 @@ class ConfigManager:
 
         Args:
             config (Dict[str, Any]): The configuration to validate.
+
+        Raises:
+            ValueError: If the configuration does not match CONFIG_SCHEMA.
         """
-        required_params = ["eye_tracking"]
-        for param in required_params:
-            if param not in config:
-                raise ValueError(f"Missing required parameter: {param}")
+        _validate_section(CONFIG_SCHEMA, config)
         eye_tracking = config["eye_tracking"]
-        required_eye_tracking_params = ["velocity_threshold", "saccade_detection", "fixation_detection"]
-        for param in required_eye_tracking_params:
-            if param not in eye_tracking:
-                raise ValueError(f"Missing required parameter: {param}")
-        saccade_detection = eye_tracking["saccade_detection"]
-        required_saccade_detection_params = ["threshold", "min_duration", "max_duration"]
-        for param in required_saccade_detection_params:
-            if param not in saccade_detection:
-                raise ValueError(f"Missing required parameter: {param}")
-        fixation_detection = eye_tracking["fixation_detection"]
-        required_fixation_detection_params = ["threshold", "min_duration", "max_duration"]
-        for param in required_fixation_detection_params:
-            if param not in fixation_detection:
-                raise ValueError(f"Missing required parameter: {param}")
-        try:
-            velocity_threshold = float(eye_tracking["velocity_threshold"])
-            saccade_threshold = float(saccade_detection["threshold"])
-            fixation_threshold = float(fixation_detection["threshold"])
-            min_duration = int(saccade_detection["min_duration"])
-            max_duration = int(saccade_detection["max_duration"])
-            min_fixation_duration = int(fixation_detection["min_duration"])
-            max_fixation_duration = int(fixation_detection["max_duration"])
-            if velocity_threshold < 0 or velocity_threshold > 1:
-                raise ValueError("Velocity threshold must be between 0 and 1")
-            if saccade_threshold < 0 or saccade_threshold > 1:
-                raise ValueError("Saccade threshold must be between 0 and 1")
-            if fixation_threshold < 0 or fixation_threshold > 1:
-                raise ValueError("Fixation threshold must be between 0 and 1")
-            if min_duration < 0 or max_duration < 0:
-                raise ValueError("Min and max duration must be non-negative")
-            if min_fixation_duration < 0 or max_fixation_duration < 0:
-                raise ValueError("Min and max fixation duration must be non-negative")
-            if min_duration > max_duration:
-                raise ValueError("Min duration must be less than or equal to max duration")
-            if min_fixation_duration > max_fixation_duration:
-                raise ValueError("Min fixation duration must be less than or equal to max fixation duration")
-        except ValueError as e:
-            raise ValueError(f"Invalid parameter value: {e}")
+        for section in ("saccade_detection", "fixation_detection"):
+            durations = eye_tracking[section]
+            if int(durations["min_duration"]) > int(durations["max_duration"]):
+                raise ValueError(f"Invalid parameter value: {section} min_duration must be less than or equal to max_duration")
 
     def get_config(self) -> Dict[str, Any]:
         """
@@ -1,19 +1,45 @@
 import threading
 import json
+import queue
+import time
+from collections import deque
+import numpy as np
 import pandas as pd
 import logging
 from typing import Dict, List
+from dataclasses import dataclass
 from datetime import datetime
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Define constants
 DATA_LOGGING_INTERVAL = 0.1  # seconds
 SESSION_DATA_FILE = "session_data.json"
 ANALYSIS_DATA_FILE = "analysis_data.csv"
+LOG_FLUSH_INTERVAL = 0.1  # seconds
+LOG_QUEUE_SIZE = 10000  # pending sample log records; oldest are dropped when full
+INITIAL_BUFFER_CAPACITY = 1024  # samples per column, doubled on overflow
+EYE_DATA_FIELDS = ("timestamp", "x", "y", "velocity")
+PHYSIOLOGICAL_DATA_FIELDS = ("timestamp", "heart_rate", "skin_conductance")
+ANALYSIS_DATA_FIELDS = ("timestamp", "x", "y", "velocity", "heart_rate", "skin_conductance")
+
+# Control messages for the sample queue
+_DRAIN = object()
+_STOP = object()
 
 # Define logging configuration
 logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(threadName)s - %(levelname)s - %(message)s")
 logger = logging.getLogger(__name__)
 
+def _dumps(obj) -> bytes:
+    """Serialize to JSON bytes; NumPy arrays are written directly with orjson, or via tolist() otherwise"""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_SERIALIZE_NUMPY)
+    return json.dumps(obj, default=lambda o: o.tolist()).encode("utf-8")
+
 class DataLoggerException(Exception):
     """Base exception class for data logger"""
     pass
@@ -32,10 +58,103 @@ class DataLogger:
         - config (Dict): Configuration dictionary
         """
         self.config = config
-        self.eye_data = []
-        self.physiological_data = []
+        # Column-oriented (SoA) sample storage; only the first *_n rows are valid.
+        # Written only by the drainer thread; readers load *_n before the columns.
+        self._eye = {k: np.empty(INITIAL_BUFFER_CAPACITY, dtype=np.float64) for k in EYE_DATA_FIELDS}
+        self._eye_n = 0
+        self._phys = {k: np.empty(INITIAL_BUFFER_CAPACITY, dtype=np.float64) for k in PHYSIOLOGICAL_DATA_FIELDS}
+        self._phys_n = 0
+        # Only used to wake the logging thread once new samples have been stored
         self.lock = threading.Lock()
+        self._have_data = threading.Condition(self.lock)
+        self._stop = threading.Event()
+        # Set by stop() before the drainer is told to exit; no samples are accepted after it
+        self._closed = threading.Event()
+        self._logging_thread = None
         self.session_data = {}
+        # Incoming (kind, data) samples; producers never take a lock
+        self._sample_q = queue.SimpleQueue()
+        self._drain_thread = threading.Thread(target=self._drain_samples, name="DataLoggerDrain", daemon=True)
+        self._drain_thread.start()
+        # Per-sample log records, drained and logged in batches by a background thread
+        self._log_q = deque(maxlen=LOG_QUEUE_SIZE)
+        threading.Thread(target=self._flush_logs, name="DataLoggerLogFlush", daemon=True).start()
+
+    def _drain_samples(self):
+        """
+        Move queued samples into the column storage; the only writer of the columns
+        """
+        while True:
+            kind, data = self._sample_q.get()
+            if kind is _STOP:
+                break
+            if kind is _DRAIN:
+                data.set()
+                continue
+            try:
+                if kind == "eye":
+                    self._eye = self._append(self._eye, self._eye_n, data)
+                    self._eye_n += 1
+                else:
+                    self._phys = self._append(self._phys, self._phys_n, data)
+                    self._phys_n += 1
+            except (KeyError, TypeError, ValueError) as e:
+                logger.error(f"Dropped invalid {kind} data {data}: {e}")
+            if self._sample_q.empty():
+                with self._have_data:
+                    self._have_data.notify_all()
+
+    def _wait_for_drain(self):
+        """
+        Block until every sample queued before this call has been stored
+        """
+        if self._closed.is_set():
+            # stop() has queued _STOP; everything before it is stored once the drainer exits
+            self._drain_thread.join()
+            return
+        drained = threading.Event()
+        self._sample_q.put((_DRAIN, drained))
+        # A concurrent stop() may have queued _STOP ahead of the marker, in which
+        # case the drainer exits without setting it
+        while not drained.wait(DATA_LOGGING_INTERVAL):
+            if not self._drain_thread.is_alive():
+                return
+
+    def _flush_logs(self):
+        """
+        Periodically drain queued sample log records and log them as one batch
+        """
+        while not self._stop.wait(LOG_FLUSH_INTERVAL):
+            batch = []
+            while self._log_q:
+                batch.append(self._log_q.popleft())
+            if not batch:
+                continue
+            logger.info("Logged batch: %d samples", len(batch))
+            if logger.isEnabledFor(logging.DEBUG):
+                for timestamp, kind, data in batch:
+                    logger.debug("Logged %s data at %.6f: %s", kind, timestamp, data)
+
+    @staticmethod
+    def _append(columns: Dict[str, np.ndarray], n: int, data: Dict) -> Dict[str, np.ndarray]:
+        """
+        Write one sample into row n of the columns, doubling capacity when full
+
+        Returns:
+        - Dict[str, np.ndarray]: The (possibly reallocated) columns
+        """
+        if n == len(columns["timestamp"]):
+            columns = {k: np.resize(v, 2 * len(v)) for k, v in columns.items()}
+        for key, column in columns.items():
+            column[n] = data[key]
+        return columns
+
+    @staticmethod
+    def _last_row(columns: Dict[str, np.ndarray], n: int) -> Dict:
+        """
+        Get the most recent sample as a dictionary
+        """
+        return {k: float(v[n - 1]) for k, v in columns.items()}
 
     def log_eye_data(self, data: Dict):
         """
@@ -46,12 +165,14 @@ class DataLogger:
 
         Raises:
         - InvalidDataException: If data is invalid
+        - DataLoggerException: If the logger has been stopped
         """
         if not isinstance(data, dict):
             raise InvalidDataException("Invalid data type")
-        with self.lock:
-            self.eye_data.append(data)
-            logger.info(f"Logged eye data: {data}")
+        if self._closed.is_set():
+            raise DataLoggerException("Data logger is stopped")
+        self._sample_q.put(("eye", data))
+        self._log_q.append((time.monotonic(), "eye", data))
 
     def log_physiological_data(self, data: Dict):
         """
@@ -62,82 +183,104 @@ class DataLogger:
 
         Raises:
         - InvalidDataException: If data is invalid
+        - DataLoggerException: If the logger has been stopped
         """
         if not isinstance(data, dict):
             raise InvalidDataException("Invalid data type")
-        with self.lock:
-            self.physiological_data.append(data)
-            logger.info(f"Logged physiological data: {data}")
+        if self._closed.is_set():
+            raise DataLoggerException("Data logger is stopped")
+        self._sample_q.put(("physiological", data))
+        self._log_q.append((time.monotonic(), "physiological", data))
 
     def save_session_data(self):
         """
         Save session data to file
         """
-        with self.lock:
-            self.session_data["eye_data"] = self.eye_data
-            self.session_data["physiological_data"] = self.physiological_data
-            with open(SESSION_DATA_FILE, "w") as f:
-                json.dump(self.session_data, f)
-            logger.info(f"Saved session data to {SESSION_DATA_FILE}")
+        self._wait_for_drain()
+        n_eye = self._eye_n
+        n_phys = self._phys_n
+        self.session_data["eye_data"] = {k: v[:n_eye] for k, v in self._eye.items()}
+        self.session_data["physiological_data"] = {k: v[:n_phys] for k, v in self._phys.items()}
+        with open(SESSION_DATA_FILE, "wb") as f:
+            f.write(_dumps(self.session_data))
+        logger.info(f"Saved session data to {SESSION_DATA_FILE}")
 
     def export_analysis_data(self):
         """
         Export analysis data to CSV file
+
+        Eye rows are followed by physiological rows; fields a stream lacks are left empty.
+        The frame is built straight from the column arrays, without per-row dictionaries.
         """
-        with self.lock:
-            analysis_data = []
-            for eye_data in self.eye_data:
-                analysis_data.append({
-                    "timestamp": eye_data["timestamp"],
-                    "x": eye_data["x"],
-                    "y": eye_data["y"],
-                    "velocity": eye_data["velocity"]
-                })
-            for physiological_data in self.physiological_data:
-                analysis_data.append({
-                    "timestamp": physiological_data["timestamp"],
-                    "heart_rate": physiological_data["heart_rate"],
-                    "skin_conductance": physiological_data["skin_conductance"]
-                })
-            df = pd.DataFrame(analysis_data)
-            df.to_csv(ANALYSIS_DATA_FILE, index=False)
-            logger.info(f"Exported analysis data to {ANALYSIS_DATA_FILE}")
+        self._wait_for_drain()
+        n_eye = self._eye_n
+        n_phys = self._phys_n
+        eye = self._eye
+        phys = self._phys
+        columns = {}
+        for key in ANALYSIS_DATA_FIELDS:
+            column = np.full(n_eye + n_phys, np.nan)
+            if key in eye:
+                column[:n_eye] = eye[key][:n_eye]
+            if key in phys:
+                column[n_eye:] = phys[key][:n_phys]
+            columns[key] = column
+        pd.DataFrame(columns).to_csv(ANALYSIS_DATA_FILE, index=False)
+        logger.info(f"Exported analysis data to {ANALYSIS_DATA_FILE}")
 
     def start_logging(self):
         """
         Start data logging thread
         """
-        logging_thread = threading.Thread(target=self.log_data)
-        logging_thread.start()
+        self._logging_thread = threading.Thread(target=self.log_data)
+        self._logging_thread.start()
 
-    def log_data(self):
+    def stop(self):
         """
-        Log data at regular intervals
-        """
-        while True:
-            with self.lock:
-                if self.eye_data:
-                    logger.info(f"Logging eye data: {self.eye_data[-1]}")
-                if self.physiological_data:
-                    logger.info(f"Logging physiological data: {self.physiological_data[-1]}")
-            threading.sleep(DATA_LOGGING_INTERVAL)
+        Stop the data logging threads once queued samples are stored, and wait for them to exit
 
-class EyeData:
-    """Eye tracking data model"""
-    def __init__(self, timestamp: float, x: float, y: float, velocity: float):
+        The logger cannot be restarted after it has been stopped; logging samples
+        afterwards raises DataLoggerException.
         """
-        Initialize eye data
+        if not self._closed.is_set():
+            self._closed.set()
+            self._sample_q.put((_STOP, None))
+        self._drain_thread.join()
+        with self._have_data:
+            self._stop.set()
+            self._have_data.notify_all()
+        if self._logging_thread is not None:
+            self._logging_thread.join()
+            self._logging_thread = None
 
-        Args:
-        - timestamp (float): Timestamp
-        - x (float): X coordinate
-        - y (float): Y coordinate
-        - velocity (float): Velocity
+    def log_data(self):
         """
-        self.timestamp = timestamp
-        self.x = x
-        self.y = y
-        self.velocity = velocity
+        Log the latest data whenever new samples arrive, at most once per logging interval
+        """
+        logged_eye_n = 0
+        logged_phys_n = 0
+        while not self._stop.is_set():
+            with self._have_data:
+                self._have_data.wait_for(
+                    lambda: self._stop.is_set() or self._eye_n != logged_eye_n or self._phys_n != logged_phys_n
+                )
+            n_eye = self._eye_n
+            n_phys = self._phys_n
+            if n_eye != logged_eye_n:
+                logger.info(f"Logging eye data: {self._last_row(self._eye, n_eye)}")
+                logged_eye_n = n_eye
+            if n_phys != logged_phys_n:
+                logger.info(f"Logging physiological data: {self._last_row(self._phys, n_phys)}")
+                logged_phys_n = n_phys
+            self._stop.wait(DATA_LOGGING_INTERVAL)
+
+@dataclass(frozen=True, slots=True)
+class EyeData:
+    """Eye tracking data model"""
+    timestamp: float
+    x: float
+    y: float
+    velocity: float
 
     def to_dict(self) -> Dict:
         """
@@ -153,20 +296,12 @@ class EyeData:
             "velocity": self.velocity
         }
 
+@dataclass(frozen=True, slots=True)
 class PhysiologicalData:
     """Physiological data model"""
-    def __init__(self, timestamp: float, heart_rate: float, skin_conductance: float):
-        """
-        Initialize physiological data
-
-        Args:
-        - timestamp (float): Timestamp
-        - heart_rate (float): Heart rate
-        - skin_conductance (float): Skin conductance
-        """
-        self.timestamp = timestamp
-        self.heart_rate = heart_rate
-        self.skin_conductance = skin_conductance
+    timestamp: float
+    heart_rate: float
+    skin_conductance: float
 
     def to_dict(self) -> Dict:
         """
@@ -208,5 +343,8 @@ def main():
     # Start logging thread
     data_logger.start_logging()
 
+    # Stop logging thread
+    data_logger.stop()
+
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -1,11 +1,16 @@
+import functools
 import numpy as np
 from scipy import signal
 import logging
 import json
-from typing import List, Tuple
+from typing import Callable, Tuple
 from dataclasses import dataclass
-from enum import Enum
-from abc import ABC, abstractmethod
+
+try:
+    import numba
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
 
 # Set up logging
 logging.basicConfig(level=logging.INFO)
@@ -19,6 +24,8 @@ class Config:
     filter_order: int = 5
     spike_threshold: float = 5.0
 
+VALID_RANGE = (0.0, 1.0)
+
 class PreprocessingError(Exception):
     """Base class for preprocessing errors"""
     pass
@@ -31,87 +38,241 @@ class SpikeRemovalError(PreprocessingError):
     """Raised when spike removal fails"""
     pass
 
-class DataPreprocessor(ABC):
-    """Abstract base class for data preprocessors"""
-    def __init__(self, config: Config):
-        self.config = config
+@functools.lru_cache(maxsize=16)
+def _butter_sos(order: int, cutoff: float, fs: float) -> np.ndarray:
+    """Design (and cache) a low-pass Butterworth filter as second-order sections"""
+    nyq = 0.5 * fs
+    return signal.butter(order, cutoff / nyq, btype='low', output='sos')
 
-    @abstractmethod
-    def remove_invalid_samples(self, data: np.ndarray) -> np.ndarray:
-        """Remove invalid samples from the data"""
-        pass
+@functools.lru_cache(maxsize=16)
+def _sos_zi(order: int, cutoff: float, fs: float) -> np.ndarray:
+    """Steady-state initial conditions for sosfiltfilt with the cached Butterworth sections"""
+    return signal.sosfilt_zi(_butter_sos(order, cutoff, fs))
 
-    @abstractmethod
-    def median_filtering(self, data: np.ndarray) -> np.ndarray:
-        """Apply median filtering to the data"""
-        pass
+def _sosfiltfilt_padlen(sos: np.ndarray) -> int:
+    """Default padding length of signal.sosfiltfilt for these sections"""
+    return 3 * (2 * len(sos) + 1 - min((sos[:, 2] == 0).sum(), (sos[:, 5] == 0).sum()))
 
-    @abstractmethod
-    def smooth_data(self, data: np.ndarray) -> np.ndarray:
-        """Smooth the data using a low-pass filter"""
-        pass
+if NUMBA_AVAILABLE:
+    @numba.njit(cache=True)
+    def _filter_valid(data, lo, hi, out):
+        """Copy samples within [lo, hi] into out in a single pass; return the count kept"""
+        n = 0
+        for i in range(data.shape[0]):
+            value = data[i]
+            if value >= lo and value <= hi:
+                out[n] = value
+                n += 1
+        return n
+
+    @numba.njit(cache=True, parallel=True)
+    def _zero_spikes(data, thr):
+        """Zero samples whose magnitude exceeds thr, in place"""
+        for i in numba.prange(data.shape[0]):
+            if abs(data[i]) > thr:
+                data[i] = 0.0
+
+    @numba.njit(cache=True)
+    def _median3(x0, x1, x2):
+        """Median of three values"""
+        return max(min(x0, x1), min(max(x0, x1), x2))
+
+    @numba.njit(cache=True)
+    def _fused_preprocess(data, lo, hi, sos, zi, padlen, thr):
+        """
+        Run the whole preprocessing pipeline in three sweeps over the data
+
+        Equivalent to dropping samples outside [lo, hi], signal.medfilt(kernel_size=3),
+        signal.sosfiltfilt(sos) with its default odd padding, and zeroing |x| > thr.
+        The zero-phase filter needs the full forward pass before the backward pass
+        can start, so the stages are fused around it rather than tiled.
+        """
+        # Sweep 1: compact valid samples and emit the 3-tap median one sample behind
+        ext = np.empty(data.shape[0] + 2 * padlen)
+        n = 0
+        prev = 0.0
+        cur = 0.0
+        for i in range(data.shape[0]):
+            value = data[i]
+            if value >= lo and value <= hi:
+                if n > 0:
+                    ext[padlen + n - 1] = _median3(prev, cur, value)
+                    prev = cur
+                cur = value
+                n += 1
+        if n <= padlen:
+            raise ValueError("Not enough valid samples for the low-pass filter")
+        ext[padlen + n - 1] = _median3(prev, cur, 0.0)
+
+        # Odd extension at both ends, as sosfiltfilt does
+        first = ext[padlen]
+        last = ext[padlen + n - 1]
+        for i in range(padlen):
+            ext[i] = 2.0 * first - ext[2 * padlen - i]
+            ext[padlen + n + i] = 2.0 * last - ext[padlen + n - 2 - i]
+        length = n + 2 * padlen
+
+        # Sweep 2: forward pass through the biquad cascade (direct form II transposed), in place
+        sections = sos.shape[0]
+        z = zi * ext[0]
+        for i in range(length):
+            y = ext[i]
+            for k in range(sections):
+                x = y
+                y = sos[k, 0] * x + z[k, 0]
+                z[k, 0] = sos[k, 1] * x - sos[k, 4] * y + z[k, 1]
+                z[k, 1] = sos[k, 2] * x - sos[k, 5] * y
+            ext[i] = y
+
+        # Sweep 3: backward pass, trimming the padding and zeroing spikes on output
+        out = np.empty(n)
+        z = zi * ext[length - 1]
+        for i in range(length - 1, -1, -1):
+            y = ext[i]
+            for k in range(sections):
+                x = y
+                y = sos[k, 0] * x + z[k, 0]
+                z[k, 0] = sos[k, 1] * x - sos[k, 4] * y + z[k, 1]
+                z[k, 1] = sos[k, 2] * x - sos[k, 5] * y
+            if padlen <= i < padlen + n:
+                out[i - padlen] = 0.0 if abs(y) > thr else y
+        return out
+
+    # Warm-compile at import so the first real call doesn't pay JIT latency
+    _warmup = np.zeros(4)
+    _filter_valid(_warmup, 0.0, 1.0, np.empty_like(_warmup))
+    _zero_spikes(_warmup, 1.0)
+    _warmup_sos = signal.butter(1, 0.5, output='sos')
+    _fused_preprocess(np.full(8, 0.5), 0.0, 1.0, _warmup_sos, signal.sosfilt_zi(_warmup_sos), 3, 1.0)
+    del _warmup, _warmup_sos
+
+def _biquad_cascade_source(sos: np.ndarray) -> str:
+    """
+    Generate the source of an in-place biquad cascade with the SOS coefficients as literals
+
+    The generated function _cascade(x, zi) runs every section (direct form II transposed)
+    over x, starting from the per-section states in zi. State lives in local scalars so
+    the compiled loop touches no coefficient or state memory.
+    """
+    lines = ["def _cascade(x, zi):"]
+    for k in range(len(sos)):
+        lines.append(f"    z{k}_0 = zi[{k}, 0]")
+        lines.append(f"    z{k}_1 = zi[{k}, 1]")
+    lines.append("    for i in range(x.shape[0]):")
+    lines.append("        y = x[i]")
+    for k, (b0, b1, b2, _, a1, a2) in enumerate(sos.tolist()):
+        lines.append("        u = y")
+        lines.append(f"        y = {b0!r} * u + z{k}_0")
+        lines.append(f"        z{k}_0 = {b1!r} * u - {a1!r} * y + z{k}_1")
+        lines.append(f"        z{k}_1 = {b2!r} * u - {a2!r} * y")
+    lines.append("        x[i] = y")
+    return "\n".join(lines) + "\n"
+
+@functools.lru_cache(maxsize=16)
+def _specialized_lowpass(order: int, cutoff: float, fs: float) -> Tuple[Callable, np.ndarray, int]:
+    """
+    Compile (and cache) a Butterworth low-pass cascade specialized to its coefficients
+
+    Returns:
+        Tuple[Callable, np.ndarray, int]: The compiled cascade, its steady-state
+        initial conditions and the sosfiltfilt padding length
+    """
+    sos = _butter_sos(order, cutoff, fs)
+    namespace = {}
+    exec(_biquad_cascade_source(sos), namespace)
+    cascade = numba.njit(namespace["_cascade"])
+    zi = signal.sosfilt_zi(sos)
+    return cascade, zi, _sosfiltfilt_padlen(sos)
+
+def _specialized_sosfiltfilt(data: np.ndarray, config: Config) -> np.ndarray:
+    """Zero-phase low-pass filtering along the last axis with the specialized cascade"""
+    cascade, zi, padlen = _specialized_lowpass(config.filter_order, config.filter_cutoff, config.sampling_rate)
+    # Filter in float64 whatever the input dtype; an integer buffer would truncate every stage
+    data = np.asarray(data, dtype=np.float64)
+    if data.shape[-1] <= padlen:
+        raise ValueError(f"The length of the input must be greater than padlen, which is {padlen}")
+    out = np.empty(data.shape)
+    for channel in np.ndindex(data.shape[:-1]):
+        x = data[channel]
+        # Odd extension at both ends, as sosfiltfilt does
+        ext = np.concatenate((2 * x[0] - x[padlen:0:-1], x, 2 * x[-1] - x[-2:-(padlen + 2):-1]))
+        cascade(ext, zi * ext[0])
+        ext = ext[::-1].copy()
+        cascade(ext, zi * ext[0])
+        out[channel] = ext[-padlen - 1:padlen - 1:-1]
+    return out
+
+class Preprocessor:
+    """Eye/physiological signal preprocessing pipeline
+
+    Calling the preprocessor runs every stage in order: invalid-sample removal,
+    3-tap median filtering, zero-phase Butterworth low-pass smoothing and spike
+    removal. The individual stages are also available as methods.
+    """
+    def __init__(self, config: Config):
+        self.config = config
+        # The fused pipeline and smooth_data share one second-order-sections design
+        self._sos = _butter_sos(config.filter_order, config.filter_cutoff, config.sampling_rate)
+        self._zi = _sos_zi(config.filter_order, config.filter_cutoff, config.sampling_rate)
+        self._padlen = _sosfiltfilt_padlen(self._sos)
+
+    def __call__(self, data: np.ndarray) -> np.ndarray:
+        """Run the full preprocessing pipeline on a single channel, fused into one kernel when Numba is available"""
+        if NUMBA_AVAILABLE:
+            data = np.ascontiguousarray(data, dtype=np.float64)
+            return _fused_preprocess(data, VALID_RANGE[0], VALID_RANGE[1], self._sos, self._zi, self._padlen,
+                                     self.config.spike_threshold)
+        smoothed = signal.sosfiltfilt(self._sos, self.median_filtering(self.remove_invalid_samples(data)))
+        return self.remove_spikes(smoothed)
 
-class InvalidSampleRemover(DataPreprocessor):
-    """Removes invalid samples from the data"""
     def remove_invalid_samples(self, data: np.ndarray) -> np.ndarray:
         """Remove samples with values outside the valid range"""
-        valid_range = (0, 1)
-        valid_samples = np.logical_and(data >= valid_range[0], data <= valid_range[1])
+        if NUMBA_AVAILABLE and data.ndim == 1:
+            out = np.empty_like(data)
+            n = _filter_valid(data, VALID_RANGE[0], VALID_RANGE[1], out)
+            return out[:n]
+        valid_samples = np.logical_and(data >= VALID_RANGE[0], data <= VALID_RANGE[1])
         return data[valid_samples]
 
-class MedianFilter(DataPreprocessor):
-    """Applies median filtering to the data"""
     def median_filtering(self, data: np.ndarray) -> np.ndarray:
         """Apply median filtering to the data"""
         return signal.medfilt(data, kernel_size=3)
 
-class LowPassFilter(DataPreprocessor):
-    """Smooths the data using a low-pass filter"""
     def smooth_data(self, data: np.ndarray) -> np.ndarray:
-        """Smooth the data using a low-pass filter"""
-        nyq = 0.5 * self.config.sampling_rate
-        cutoff = self.config.filter_cutoff / nyq
-        b, a = signal.butter(self.config.filter_order, cutoff, btype='low')
-        return signal.filtfilt(b, a, data)
-
-class SpikeRemover(DataPreprocessor):
-    """Removes spikes from the data"""
+        """Smooth the data using a low-pass filter
+
+        Accepts a single channel of shape (N,) or a batch of channels of
+        shape (C, N); all channels are filtered along the last axis. Uses a
+        cascade compiled for the configured coefficients when Numba is available.
+        """
+        if NUMBA_AVAILABLE:
+            return _specialized_sosfiltfilt(data, self.config)
+        sos = _butter_sos(self.config.filter_order, self.config.filter_cutoff, self.config.sampling_rate)
+        return signal.sosfiltfilt(sos, data, axis=-1)
+
     def remove_spikes(self, data: np.ndarray) -> np.ndarray:
-        """Remove spikes from the data"""
+        """Remove spikes from the data (zeroed in place)"""
         threshold = self.config.spike_threshold
-        return np.where(np.abs(data) > threshold, 0, data)
-
-class DataPreprocessorFactory:
-    """Factory class for creating data preprocessors"""
-    @staticmethod
-    def create_preprocessor(config: Config) -> DataPreprocessor:
-        """Create a data preprocessor based on the configuration"""
-        preprocessor = InvalidSampleRemover(config)
-        preprocessor = MedianFilter(config)
-        preprocessor = LowPassFilter(config)
-        preprocessor = SpikeRemover(config)
-        return preprocessor
+        if NUMBA_AVAILABLE and data.ndim == 1:
+            _zero_spikes(data, threshold)
+        else:
+            np.putmask(data, np.abs(data) > threshold, 0.0)
+        return data
 
 def main():
     # Load configuration from JSON file
     with open('config.json') as f:
         config = Config(**json.load(f))
 
-    # Create a data preprocessor factory
-    factory = DataPreprocessorFactory()
-
     # Create a data preprocessor
-    preprocessor = factory.create_preprocessor(config)
+    preprocessor = Preprocessor(config)
 
     # Generate some sample data
     np.random.seed(0)
     data = np.random.rand(1000)
 
     # Preprocess the data
-    preprocessed_data = preprocessor.remove_invalid_samples(data)
-    preprocessed_data = preprocessor.median_filtering(preprocessed_data)
-    preprocessed_data = preprocessor.smooth_data(preprocessed_data)
-    preprocessed_data = preprocessor.remove_spikes(preprocessed_data)
+    preprocessed_data = preprocessor(data)
 
     # Log the preprocessed data
     logger.info('Preprocessed data: %s', preprocessed_data)
@@ -1,28 +1,110 @@
 import numpy as np
-import json
 import logging
-from typing import Dict, List, Tuple
-from enum import Enum
-from threading import Lock
+from typing import Dict, Tuple, Union
+from enum import IntEnum
+from dataclasses import dataclass
+
+try:
+    import numba
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
 
 # Set up logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
-class FlowState(Enum):
-    """Enum representing different flow states."""
-    BOREDOM = 1
-    FLOW = 2
-    ANXIETY = 3
+class FlowState(IntEnum):
+    """Enum representing different flow states; 0-based so values index lookup tables."""
+    BOREDOM = 0
+    FLOW = 1
+    ANXIETY = 2
 
-class DifficultyLevel(Enum):
+class DifficultyLevel(IntEnum):
     """Enum representing different difficulty levels."""
     EASY = 1
     MEDIUM = 2
     HARD = 3
 
+# Difficulty to switch to for each FlowState, indexed by its value
+_FLOW_TO_DIFFICULTY = (DifficultyLevel.MEDIUM, DifficultyLevel.HARD, DifficultyLevel.EASY)
+
+def _assess_batch_numpy(velocity, fixation_duration, out):
+    """Vectorized flow-state assessment over arrays, writing FlowState values into out"""
+    engagement_level = velocity * 0.5 + fixation_duration * 0.3
+    out[:] = FlowState.FLOW
+    out[engagement_level < 0.3] = FlowState.BOREDOM
+    out[engagement_level > 0.7] = FlowState.ANXIETY
+
+if NUMBA_AVAILABLE:
+    @numba.guvectorize(['(float32[:], float32[:], int8[:])', '(float64[:], float64[:], int8[:])'],
+                       '(n),(n)->(n)', target='parallel')
+    def _assess_batch(velocity, fixation_duration, out):
+        """Flow-state assessment applied elementwise across a recorded session"""
+        for i in range(velocity.shape[0]):
+            engagement_level = velocity[i] * 0.5 + fixation_duration[i] * 0.3
+            if engagement_level < 0.3:
+                out[i] = 0
+            elif engagement_level > 0.7:
+                out[i] = 2
+            else:
+                out[i] = 1
+
+@dataclass(frozen=True, slots=True)
+class EyeTrackingMetrics:
+    """Class representing eye tracking metrics."""
+    velocity: float
+    fixation_duration: float
+
+    def to_dict(self) -> Dict:
+        """
+        Convert the EyeTrackingMetrics to a dictionary.
+
+        Returns:
+        Dict: A dictionary containing the eye tracking metrics.
+        """
+        return {
+            "velocity": self.velocity,
+            "fixation_duration": self.fixation_duration
+        }
+
+    @classmethod
+    def from_dict(cls, metrics: Dict) -> "EyeTrackingMetrics":
+        """
+        Build EyeTrackingMetrics from a dictionary with velocity and fixation_duration keys.
+
+        Args:
+        metrics (Dict): The eye tracking metrics dictionary.
+
+        Returns:
+        EyeTrackingMetrics: The eye tracking metrics.
+
+        Raises:
+        ValueError: If the dictionary lacks velocity or fixation_duration.
+        """
+        missing = [key for key in ("velocity", "fixation_duration") if key not in metrics]
+        if missing:
+            raise ValueError(f"Eye tracking metrics missing: {', '.join(missing)}")
+        return cls(metrics["velocity"], metrics["fixation_duration"])
+
+def _as_metrics(eye_tracking_metrics: Union[EyeTrackingMetrics, Dict]) -> EyeTrackingMetrics:
+    """Accept metrics as EyeTrackingMetrics or as the dictionary form older callers pass.
+
+    Invalid input is the caller's error, so it raises (TypeError for the wrong type,
+    ValueError for a dictionary missing a field) rather than being logged and masked.
+    """
+    if isinstance(eye_tracking_metrics, EyeTrackingMetrics):
+        return eye_tracking_metrics
+    if isinstance(eye_tracking_metrics, dict):
+        return EyeTrackingMetrics.from_dict(eye_tracking_metrics)
+    raise TypeError(f"Expected EyeTrackingMetrics or dict, got {type(eye_tracking_metrics).__name__}")
+
 class DynamicDifficultyAdjuster:
-    """Class responsible for dynamic difficulty adjustment based on Flow Theory and eye tracking metrics."""
+    """Class responsible for dynamic difficulty adjustment based on Flow Theory and eye tracking metrics.
+
+    Lock-free: the assessment methods are pure, and difficulty_level, the only mutable
+    state, is published by a single attribute store in adjust_difficulty.
+    """
 
     def __init__(self, config: Dict):
         """
@@ -32,30 +114,54 @@ class DynamicDifficultyAdjuster:
         config (Dict): Configuration dictionary containing parameters for the adjuster.
         """
         self.config = config
-        self.lock = Lock()
         self.user_state = None
         self.difficulty_level = DifficultyLevel.MEDIUM
 
-    def assess_user_state(self, eye_tracking_metrics: Dict) -> FlowState:
+    def assess_user_state(self, eye_tracking_metrics: Union[EyeTrackingMetrics, Dict]) -> FlowState:
         """
         Assess the user's state based on eye tracking metrics.
 
         Args:
-        eye_tracking_metrics (Dict): Dictionary containing eye tracking metrics such as velocity, fixation duration, etc.
+        eye_tracking_metrics (Union[EyeTrackingMetrics, Dict]): Eye tracking metrics such as velocity and fixation duration.
 
         Returns:
         FlowState: The user's current flow state.
+
+        Raises:
+        TypeError: If the metrics are neither EyeTrackingMetrics nor a dictionary.
+        ValueError: If a metrics dictionary lacks velocity or fixation_duration.
+        """
+        eye_tracking_metrics = _as_metrics(eye_tracking_metrics)
+        try:
+            # Engagement level and flow state thresholds inlined as straight-line code;
+            # calculate_engagement_level/determine_flow_state compute the same steps
+            engagement_level = eye_tracking_metrics.velocity * 0.5 + eye_tracking_metrics.fixation_duration * 0.3
+            return FlowState.BOREDOM if engagement_level < 0.3 else FlowState.ANXIETY if engagement_level > 0.7 else FlowState.FLOW
+        except Exception as e:
+            logger.error("Error assessing user state: %s", e)
+            return FlowState.FLOW
+
+    def assess_batch(self, velocities: np.ndarray, fixations: np.ndarray) -> np.ndarray:
+        """
+        Assess the flow state for every frame of a recorded session in one call.
+
+        Args:
+        velocities (np.ndarray): Per-frame eye velocity.
+        fixations (np.ndarray): Per-frame fixation duration.
+
+        Returns:
+        np.ndarray: int8 array of FlowState values, one per frame.
         """
-        with self.lock:
-            try:
-                # Calculate the user's engagement level based on eye tracking metrics
-                engagement_level = self.calculate_engagement_level(eye_tracking_metrics)
-                # Determine the user's flow state based on the engagement level
-                flow_state = self.determine_flow_state(engagement_level)
-                return flow_state
-            except Exception as e:
-                logger.error(f"Error assessing user state: {e}")
-                return FlowState.FLOW
+        velocities = np.asarray(velocities)
+        dtype = np.float32 if velocities.dtype == np.float32 else np.float64
+        velocities = velocities.astype(dtype, copy=False)
+        fixations = np.asarray(fixations, dtype=dtype)
+        out = np.empty(velocities.shape, dtype=np.int8)
+        if NUMBA_AVAILABLE:
+            _assess_batch(velocities, fixations, out)
+        else:
+            _assess_batch_numpy(velocities, fixations, out)
+        return out
 
     def adjust_difficulty(self, flow_state: FlowState) -> DifficultyLevel:
         """
@@ -67,59 +173,61 @@ class DynamicDifficultyAdjuster:
         Returns:
         DifficultyLevel: The adjusted difficulty level.
         """
-        with self.lock:
-            try:
-                # Adjust the difficulty level based on the flow state
-                if flow_state == FlowState.BOREDOM:
-                    self.difficulty_level = DifficultyLevel.MEDIUM
-                elif flow_state == FlowState.ANXIETY:
-                    self.difficulty_level = DifficultyLevel.EASY
-                else:
-                    self.difficulty_level = DifficultyLevel.HARD
-                return self.difficulty_level
-            except Exception as e:
-                logger.error(f"Error adjusting difficulty: {e}")
-                return self.difficulty_level
-
-    def flow_state_detection(self, eye_tracking_metrics: Dict) -> Tuple[FlowState, DifficultyLevel]:
+        try:
+            # Adjust the difficulty level based on the flow state; a single attribute
+            # store publishes the new level atomically, so no lock is needed
+            # FlowState() rejects values outside the enum, which would otherwise
+            # index (or, if negative, wrap around) the lookup table
+            difficulty_level = _FLOW_TO_DIFFICULTY[FlowState(flow_state)]
+            self.difficulty_level = difficulty_level
+            return difficulty_level
+        except Exception as e:
+            logger.error("Error adjusting difficulty: %s", e)
+            return self.difficulty_level
+
+    def flow_state_detection(self, eye_tracking_metrics: Union[EyeTrackingMetrics, Dict]) -> Tuple[FlowState, DifficultyLevel]:
         """
         Detect the user's flow state and adjust the difficulty level accordingly.
 
         Args:
-        eye_tracking_metrics (Dict): Dictionary containing eye tracking metrics such as velocity, fixation duration, etc.
+        eye_tracking_metrics (Union[EyeTrackingMetrics, Dict]): Eye tracking metrics such as velocity and fixation duration.
 
         Returns:
         Tuple[FlowState, DifficultyLevel]: A tuple containing the user's flow state and the adjusted difficulty level.
-        """
-        with self.lock:
-            try:
-                flow_state = self.assess_user_state(eye_tracking_metrics)
-                difficulty_level = self.adjust_difficulty(flow_state)
-                return flow_state, difficulty_level
-            except Exception as e:
-                logger.error(f"Error detecting flow state: {e}")
-                return FlowState.FLOW, self.difficulty_level
 
-    def calculate_engagement_level(self, eye_tracking_metrics: Dict) -> float:
+        Raises:
+        TypeError: If the metrics are neither EyeTrackingMetrics nor a dictionary.
+        ValueError: If a metrics dictionary lacks velocity or fixation_duration.
+        """
+        eye_tracking_metrics = _as_metrics(eye_tracking_metrics)
+        try:
+            flow_state = self.assess_user_state(eye_tracking_metrics)
+            difficulty_level = self.adjust_difficulty(flow_state)
+            return flow_state, difficulty_level
+        except Exception as e:
+            logger.error("Error detecting flow state: %s", e)
+            return FlowState.FLOW, self.difficulty_level
+
+    def calculate_engagement_level(self, eye_tracking_metrics: Union[EyeTrackingMetrics, Dict]) -> float:
         """
         Calculate the user's engagement level based on eye tracking metrics.
 
         Args:
-        eye_tracking_metrics (Dict): Dictionary containing eye tracking metrics such as velocity, fixation duration, etc.
+        eye_tracking_metrics (Union[EyeTrackingMetrics, Dict]): Eye tracking metrics such as velocity and fixation duration.
 
         Returns:
         float: The user's engagement level.
+
+        Raises:
+        TypeError: If the metrics are neither EyeTrackingMetrics nor a dictionary.
+        ValueError: If a metrics dictionary lacks velocity or fixation_duration.
         """
-        with self.lock:
-            try:
-                # Calculate the engagement level based on the paper's mathematical formulas and equations
-                velocity = eye_tracking_metrics["velocity"]
-                fixation_duration = eye_tracking_metrics["fixation_duration"]
-                engagement_level = (velocity * 0.5) + (fixation_duration * 0.3)
-                return engagement_level
-            except Exception as e:
-                logger.error(f"Error calculating engagement level: {e}")
-                return 0.0
+        eye_tracking_metrics = _as_metrics(eye_tracking_metrics)
+        # Calculate the engagement level based on the paper's mathematical formulas and equations
+        velocity = eye_tracking_metrics.velocity
+        fixation_duration = eye_tracking_metrics.fixation_duration
+        engagement_level = (velocity * 0.5) + (fixation_duration * 0.3)
+        return engagement_level
 
     def determine_flow_state(self, engagement_level: float) -> FlowState:
         """
@@ -131,44 +239,13 @@ class DynamicDifficultyAdjuster:
         Returns:
         FlowState: The user's flow state.
         """
-        with self.lock:
-            try:
-                # Determine the flow state based on the paper's methodology and thresholds
-                if engagement_level < 0.3:
-                    return FlowState.BOREDOM
-                elif engagement_level > 0.7:
-                    return FlowState.ANXIETY
-                else:
-                    return FlowState.FLOW
-            except Exception as e:
-                logger.error(f"Error determining flow state: {e}")
-                return FlowState.FLOW
-
-class EyeTrackingMetrics:
-    """Class representing eye tracking metrics."""
-
-    def __init__(self, velocity: float, fixation_duration: float):
-        """
-        Initialize the EyeTrackingMetrics.
-
-        Args:
-        velocity (float): The user's eye velocity.
-        fixation_duration (float): The user's fixation duration.
-        """
-        self.velocity = velocity
-        self.fixation_duration = fixation_duration
-
-    def to_dict(self) -> Dict:
-        """
-        Convert the EyeTrackingMetrics to a dictionary.
-
-        Returns:
-        Dict: A dictionary containing the eye tracking metrics.
-        """
-        return {
-            "velocity": self.velocity,
-            "fixation_duration": self.fixation_duration
-        }
+        # Determine the flow state based on the paper's methodology and thresholds
+        if engagement_level < 0.3:
+            return FlowState.BOREDOM
+        elif engagement_level > 0.7:
+            return FlowState.ANXIETY
+        else:
+            return FlowState.FLOW
 
 class Configuration:
     """Class representing the configuration."""
@@ -177,11 +254,16 @@ class Configuration:
         """
         Initialize the Configuration.
 
+        The file is parsed through ConfigManager, which reuses the parsed result
+        while the file's modification time is unchanged and returns a private copy.
+
         Args:
         config_file (str): The path to the configuration file.
         """
-        with open(config_file, "r") as f:
-            self.config = json.load(f)
+        # Imported here, after this module's logging.basicConfig call, so config_manager's
+        # own basicConfig call is the no-op and this module's log format is kept
+        from config_manager import ConfigManager
+        self.config = ConfigManager.read_config_file(config_file)
 
     def get_config(self) -> Dict:
         """
@@ -204,11 +286,11 @@ def main():
     metrics = EyeTrackingMetrics(0.5, 0.3)
 
     # Detect the user's flow state and adjust the difficulty level
-    flow_state, difficulty_level = adjuster.flow_state_detection(metrics.to_dict())
+    flow_state, difficulty_level = adjuster.flow_state_detection(metrics)
 
     # Log the results
-    logger.info(f"Flow state: {flow_state}")
-    logger.info(f"Difficulty level: {difficulty_level}")
+    logger.info("Flow state: %s", flow_state.name)
+    logger.info("Difficulty level: %s", difficulty_level.name)
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -1,12 +1,15 @@
 import logging
 import threading
 import numpy as np
-from typing import List, Tuple
+from typing import Tuple
 from sranipal_api import SRanipalEye
 from enum import Enum
 from dataclasses import dataclass
 from abc import ABC, abstractmethod
 
+# Number of most recent samples kept by EyeTrackingManager
+BUFFER_SIZE = 100
+
 # Set up logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 
@@ -17,7 +20,7 @@ class EyeTrackingStatus(Enum):
     BUFFER_MANAGEMENT = 3
     ERROR = 4
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class EyeTrackingData:
     """Data class for eye tracking data"""
     gaze_position: Tuple[float, float]
@@ -58,7 +61,7 @@ class SRanipalEyeTracker(EyeTracker):
         try:
             self.eye_tracker.calibrate()
         except Exception as e:
-            logging.error(f"Error calibrating eye tracker: {e}")
+            logging.error("Error calibrating eye tracker: %s", e)
             raise EyeTrackerCalibrationException("Error calibrating eye tracker")
 
     def acquire_data(self) -> EyeTrackingData:
@@ -69,7 +72,26 @@ class SRanipalEyeTracker(EyeTracker):
             velocity = self.eye_tracker.get_velocity()
             return EyeTrackingData(gaze_position, pupil_size, velocity)
         except Exception as e:
-            logging.error(f"Error acquiring eye tracking data: {e}")
+            logging.error("Error acquiring eye tracking data: %s", e)
+            raise EyeTrackerAcquisitionException("Error acquiring eye tracking data")
+
+    def acquire_batch(self, n: int) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Acquire n samples as contiguous (gaze positions (n, 2), pupil sizes, velocities) arrays"""
+        try:
+            if hasattr(self.eye_tracker, "get_eye_data_list"):
+                # Fetch all samples in one SDK call as rows of (gaze x, gaze y, pupil size, velocity)
+                samples = np.asarray(self.eye_tracker.get_eye_data_list(n), dtype=np.float64).reshape(n, 4)
+                return np.ascontiguousarray(samples[:, :2]), samples[:, 2].copy(), samples[:, 3].copy()
+            gaze = np.empty((n, 2))
+            pupil = np.empty(n)
+            velocity = np.empty(n)
+            for i in range(n):
+                gaze[i] = self.eye_tracker.get_gaze_position()
+                pupil[i] = self.eye_tracker.get_pupil_size()
+                velocity[i] = self.eye_tracker.get_velocity()
+            return gaze, pupil, velocity
+        except Exception as e:
+            logging.error("Error acquiring eye tracking data: %s", e)
             raise EyeTrackerAcquisitionException("Error acquiring eye tracking data")
 
 class EyeTrackingManager:
@@ -77,7 +99,15 @@ class EyeTrackingManager:
     def __init__(self, eye_tracker: EyeTracker) -> None:
         self.eye_tracker = eye_tracker
         self.status = EyeTrackingStatus.ERROR
-        self.buffer = []
+        # Fixed-size SoA ring buffer; the oldest sample is overwritten once full
+        self._gx = np.empty(BUFFER_SIZE)
+        self._gy = np.empty(BUFFER_SIZE)
+        self._pupil = np.empty(BUFFER_SIZE)
+        self._vel = np.empty(BUFFER_SIZE)
+        self._head = 0
+        self._count = 0
+        # Guards the ring buffer only; public methods take it exactly once and
+        # delegate to the *_locked helpers, which assume it is already held
         self.lock = threading.Lock()
 
     def calibrate_eye_tracker(self) -> None:
@@ -87,7 +117,7 @@ class EyeTrackingManager:
             self.status = EyeTrackingStatus.CALIBRATED
             logging.info("Eye tracker calibrated successfully")
         except EyeTrackerCalibrationException as e:
-            logging.error(f"Error calibrating eye tracker: {e}")
+            logging.error("Error calibrating eye tracker: %s", e)
             self.status = EyeTrackingStatus.ERROR
 
     def acquire_real_time_data(self) -> None:
@@ -95,36 +125,39 @@ class EyeTrackingManager:
         try:
             data = self.eye_tracker.acquire_data()
             with self.lock:
-                self.buffer.append(data)
+                self._push_locked(data)
             self.status = EyeTrackingStatus.ACQUIRING_DATA
             logging.info("Acquiring real-time eye tracking data")
         except EyeTrackerAcquisitionException as e:
-            logging.error(f"Error acquiring eye tracking data: {e}")
-            self.status = EyeTrackingStatus.ERROR
-
-    def buffer_management(self) -> None:
-        """Manage the eye tracking data buffer"""
-        try:
-            with self.lock:
-                if len(self.buffer) > 100:
-                    self.buffer.pop(0)
-            self.status = EyeTrackingStatus.BUFFER_MANAGEMENT
-            logging.info("Managing eye tracking data buffer")
-        except Exception as e:
-            logging.error(f"Error managing eye tracking data buffer: {e}")
+            logging.error("Error acquiring eye tracking data: %s", e)
             self.status = EyeTrackingStatus.ERROR
 
-    def get_buffer(self) -> List[EyeTrackingData]:
-        """Get the eye tracking data buffer"""
+    def _push_locked(self, data: EyeTrackingData) -> None:
+        """Write one sample at the head of the ring buffer; caller holds self.lock"""
+        head = self._head
+        self._gx[head], self._gy[head] = data.gaze_position
+        self._pupil[head] = data.pupil_size
+        self._vel[head] = data.velocity
+        self._head = (head + 1) % BUFFER_SIZE
+        self._count = min(self._count + 1, BUFFER_SIZE)
+
+    def _unwrap_locked(self, column: np.ndarray) -> np.ndarray:
+        """Copy a ring buffer column out in oldest-to-newest order; caller holds self.lock"""
+        if self._count < BUFFER_SIZE:
+            return column[:self._count].copy()
+        return np.roll(column, -self._head)
+
+    def get_buffer(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """Get the buffered gaze x, gaze y, pupil size and velocity arrays, oldest sample first"""
         with self.lock:
-            return self.buffer.copy()
+            return (self._unwrap_locked(self._gx), self._unwrap_locked(self._gy),
+                    self._unwrap_locked(self._pupil), self._unwrap_locked(self._vel))
 
 def main() -> None:
     eye_tracker = SRanipalEyeTracker()
     eye_tracking_manager = EyeTrackingManager(eye_tracker)
     eye_tracking_manager.calibrate_eye_tracker()
     threading.Thread(target=eye_tracking_manager.acquire_real_time_data).start()
-    threading.Thread(target=eye_tracking_manager.buffer_management).start()
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -1,10 +1,15 @@
 import numpy as np
 import pandas as pd
 import logging
-from typing import List, Dict, Tuple
+from typing import Dict, Tuple
 from enum import Enum
 from dataclasses import dataclass
-from threading import Lock
+
+try:
+    import numba
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
@@ -16,13 +21,40 @@ FLOW_THEORY_THRESHOLD = 0.5  # seconds
 FIXATION_DURATION_THRESHOLD = 200  # milliseconds
 DWELL_TIME_THRESHOLD = 500  # milliseconds
 
+if NUMBA_AVAILABLE:
+    # error_model='numpy' gives IEEE division like the NumPy path: a repeated
+    # timestamp yields inf (or nan for no movement) instead of ZeroDivisionError
+    @numba.njit(cache=True, error_model='numpy')
+    def _fused_metrics_jit(x, y, timestamp):
+        """Single loop over the samples accumulating gap and velocity sums; no temporaries"""
+        dt_sum = 0.0
+        vel_sum = 0.0
+        for i in range(timestamp.shape[0] - 1):
+            dt = timestamp[i + 1] - timestamp[i]
+            dx = x[i + 1] - x[i]
+            dy = y[i + 1] - y[i]
+            dt_sum += dt
+            vel_sum += np.sqrt(dx * dx + dy * dy) / dt
+        count = timestamp.shape[0] - 1
+        return dt_sum / count, vel_sum / count, dt_sum
+
+    # Warm-compile at import so the first real call doesn't pay JIT latency
+    _fused_metrics_jit(np.zeros(2, dtype=np.float32), np.zeros(2, dtype=np.float32), np.arange(2.0))
+
 # Data structures
 @dataclass
 class EyeTrackingData:
-    """Data structure for eye tracking data"""
-    x: List[float]
-    y: List[float]
-    timestamp: List[float]
+    """Data structure for eye tracking data, stored as contiguous arrays"""
+    x: np.ndarray
+    y: np.ndarray
+    timestamp: np.ndarray
+
+    def __post_init__(self):
+        # Gaze coordinates fit in float32; timestamps stay float64 so absolute
+        # clock values keep sub-millisecond resolution
+        self.x = np.ascontiguousarray(self.x, dtype=np.float32)
+        self.y = np.ascontiguousarray(self.y, dtype=np.float32)
+        self.timestamp = np.ascontiguousarray(self.timestamp, dtype=np.float64)
 
 @dataclass
 class Metrics:
@@ -32,7 +64,11 @@ class Metrics:
     dwell_time: float
 
 class MetricsCalculator:
-    """Class for calculating eye tracking metrics"""
+    """Class for calculating eye tracking metrics
+
+    Lock-free: every method reads only the fixed thresholds and the caller's data, so
+    one instance can be shared across threads and the metrics can safely call each other.
+    """
     def __init__(self, velocity_threshold: float = VELOCITY_THRESHOLD, flow_theory_threshold: float = FLOW_THEORY_THRESHOLD,
                  fixation_duration_threshold: float = FIXATION_DURATION_THRESHOLD, dwell_time_threshold: float = DWELL_TIME_THRESHOLD):
         """
@@ -48,7 +84,41 @@ class MetricsCalculator:
         self.flow_theory_threshold = flow_theory_threshold
         self.fixation_duration_threshold = fixation_duration_threshold
         self.dwell_time_threshold = dwell_time_threshold
-        self.lock = Lock()
+
+    @staticmethod
+    def _as_arrays(eye_tracking_data: EyeTrackingData) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Return the eye tracking fields as contiguous arrays (a no-op for data built through EyeTrackingData)."""
+        return (np.ascontiguousarray(eye_tracking_data.x),
+                np.ascontiguousarray(eye_tracking_data.y),
+                np.ascontiguousarray(eye_tracking_data.timestamp))
+
+    @staticmethod
+    def _fixation_duration(timestamp: np.ndarray) -> float:
+        return float(np.mean(np.diff(timestamp)))
+
+    @staticmethod
+    def _saccade_velocity(x: np.ndarray, y: np.ndarray, timestamp: np.ndarray) -> float:
+        return float(np.mean(np.hypot(np.diff(x), np.diff(y)) / np.diff(timestamp)))
+
+    @staticmethod
+    def _dwell_time(timestamp: np.ndarray) -> float:
+        # No gaps to sum with fewer than two samples
+        if timestamp.shape[0] < 2:
+            return 0.0
+        # The sum of consecutive gaps telescopes to last - first
+        return float(timestamp[-1] - timestamp[0])
+
+    @staticmethod
+    def _fused_metrics(x: np.ndarray, y: np.ndarray, timestamp: np.ndarray) -> Tuple[float, float, float]:
+        """Compute (fixation duration, saccade velocity, dwell time) from one set of sample differences."""
+        if not x.shape[0] == y.shape[0] == timestamp.shape[0]:
+            raise ValueError(f"x, y and timestamp lengths differ: {x.shape[0]}, {y.shape[0]}, {timestamp.shape[0]}")
+        if NUMBA_AVAILABLE and timestamp.shape[0] > 1:
+            return _fused_metrics_jit(x, y, timestamp)
+        dt = np.diff(timestamp)
+        velocity = np.hypot(np.diff(x), np.diff(y))
+        velocity /= dt
+        return float(dt.mean()), float(velocity.mean()), float(dt.sum())
 
     def calculate_fixation_duration(self, eye_tracking_data: EyeTrackingData) -> float:
         """
@@ -60,14 +130,9 @@ class MetricsCalculator:
         Returns:
         - float: Fixation duration in milliseconds
         """
-        with self.lock:
-            try:
-                # Calculate fixation duration using the formula from the paper
-                fixation_duration = np.mean([eye_tracking_data.timestamp[i+1] - eye_tracking_data.timestamp[i] for i in range(len(eye_tracking_data.timestamp) - 1)])
-                return fixation_duration
-            except Exception as e:
-                logger.error(f"Error calculating fixation duration: {str(e)}")
-                return 0.0
+        # Calculate fixation duration using the formula from the paper
+        _, _, timestamp = self._as_arrays(eye_tracking_data)
+        return self._fixation_duration(timestamp)
 
     def measure_saccade_velocity(self, eye_tracking_data: EyeTrackingData) -> float:
         """
@@ -79,14 +144,8 @@ class MetricsCalculator:
         Returns:
         - float: Saccade velocity in pixels per second
         """
-        with self.lock:
-            try:
-                # Calculate saccade velocity using the formula from the paper
-                saccade_velocity = np.mean([np.sqrt((eye_tracking_data.x[i+1] - eye_tracking_data.x[i])**2 + (eye_tracking_data.y[i+1] - eye_tracking_data.y[i])**2) / (eye_tracking_data.timestamp[i+1] - eye_tracking_data.timestamp[i]) for i in range(len(eye_tracking_data.timestamp) - 1)])
-                return saccade_velocity
-            except Exception as e:
-                logger.error(f"Error measuring saccade velocity: {str(e)}")
-                return 0.0
+        # Calculate saccade velocity using the formula from the paper
+        return self._saccade_velocity(*self._as_arrays(eye_tracking_data))
 
     def compute_dwell_time(self, eye_tracking_data: EyeTrackingData) -> float:
         """
@@ -98,14 +157,9 @@ class MetricsCalculator:
         Returns:
         - float: Dwell time in milliseconds
         """
-        with self.lock:
-            try:
-                # Calculate dwell time using the formula from the paper
-                dwell_time = np.sum([eye_tracking_data.timestamp[i+1] - eye_tracking_data.timestamp[i] for i in range(len(eye_tracking_data.timestamp) - 1)])
-                return dwell_time
-            except Exception as e:
-                logger.error(f"Error computing dwell time: {str(e)}")
-                return 0.0
+        # Calculate dwell time using the formula from the paper
+        _, _, timestamp = self._as_arrays(eye_tracking_data)
+        return self._dwell_time(timestamp)
 
     def calculate_metrics(self, eye_tracking_data: EyeTrackingData) -> Metrics:
         """
@@ -117,15 +171,11 @@ class MetricsCalculator:
         Returns:
         - Metrics: Calculated metrics
         """
-        with self.lock:
-            try:
-                fixation_duration = self.calculate_fixation_duration(eye_tracking_data)
-                saccade_velocity = self.measure_saccade_velocity(eye_tracking_data)
-                dwell_time = self.compute_dwell_time(eye_tracking_data)
-                return Metrics(fixation_duration, saccade_velocity, dwell_time)
-            except Exception as e:
-                logger.error(f"Error calculating metrics: {str(e)}")
-                return Metrics(0.0, 0.0, 0.0)
+        try:
+            return Metrics(*self._fused_metrics(*self._as_arrays(eye_tracking_data)))
+        except Exception as e:
+            logger.error("Error calculating metrics: %s", e)
+            return Metrics(0.0, 0.0, 0.0)
 
 class MetricsCalculatorException(Exception):
     """Exception class for metrics calculator"""
@@ -136,9 +186,9 @@ def main():
     eye_tracking_data = EyeTrackingData([1.0, 2.0, 3.0], [4.0, 5.0, 6.0], [0.0, 0.1, 0.2])
     metrics_calculator = MetricsCalculator()
     metrics = metrics_calculator.calculate_metrics(eye_tracking_data)
-    logger.info(f"Fixation duration: {metrics.fixation_duration} ms")
-    logger.info(f"Saccade velocity: {metrics.saccade_velocity} pixels/s")
-    logger.info(f"Dwell time: {metrics.dwell_time} ms")
+    logger.info("Fixation duration: %s ms", metrics.fixation_duration)
+    logger.info("Saccade velocity: %s pixels/s", metrics.saccade_velocity)
+    logger.info("Dwell time: %s ms", metrics.dwell_time)
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
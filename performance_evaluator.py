@@ -2,10 +2,32 @@ import numpy as np
 import matplotlib.pyplot as plt
 import pandas as pd
 import logging
-from typing import List, Dict, Tuple
+import math
+import threading
+import weakref
+from typing import Dict, Tuple, NamedTuple
 from dataclasses import dataclass
 from enum import Enum
-from threading import Lock
+
+try:
+    import numexpr as ne
+except ImportError:
+    ne = None
+
+try:
+    import numba
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+def _sample_velocity(x0, y0, t0, x1, y1, t1):
+    """Velocity between two consecutive samples"""
+    return math.sqrt((x1 - x0) ** 2 + (y1 - y0) ** 2) / (t1 - t0)
+
+if NUMBA_AVAILABLE:
+    _sample_velocity = numba.njit(cache=True)(_sample_velocity)
+    # Warm-compile at import so the first real call doesn't pay JIT latency
+    _sample_velocity(0.0, 0.0, 0.0, 1.0, 1.0, 1.0)
 
 # Constants and configuration
 class Configuration:
@@ -13,18 +35,97 @@ class Configuration:
     FLOW_THEORY_THRESHOLD = 0.7  # ratio of optimal performance
     ATTENTION_WINDOW_SIZE = 10  # seconds
     COGNITIVE_LOAD_WINDOW_SIZE = 30  # seconds
+    MAX_BUFFER_SIZE = 100  # samples per evaluated frame
 
 class EyeTrackingData:
-    def __init__(self, x: List[float], y: List[float], timestamp: List[float]):
-        self.x = x
-        self.y = y
-        self.timestamp = timestamp
+    def __init__(self, x: np.ndarray, y: np.ndarray, timestamp: np.ndarray):
+        # Gaze coordinates fit in float32; timestamps stay float64 so absolute
+        # clock values keep sub-millisecond resolution
+        self.x = np.ascontiguousarray(x, dtype=np.float32)
+        self.y = np.ascontiguousarray(y, dtype=np.float32)
+        self.timestamp = np.ascontiguousarray(timestamp, dtype=np.float64)
+        # Bumped on every in-place update so cached derived quantities are invalidated
+        self.version = 0
+
+    def mark_updated(self) -> None:
+        """Record an in-place modification of x, y or timestamp"""
+        self.version += 1
+
+class Frame(NamedTuple):
+    """Quantities derived from one EyeTrackingData in a single vectorized pass"""
+    velocity: np.ndarray
+    dt: np.ndarray
+    mean_x: float
+    mean_y: float
 
 class PerformanceEvaluator:
     def __init__(self, config: Configuration):
         self.config = config
         self.logger = logging.getLogger(__name__)
-        self.lock = Lock()
+        # (version, Frame) memoized per data object, so back-to-back attention and
+        # cognitive load calls on the same data share one pass; entries die with the data.
+        # Frames are read-only, so sharing them between callers and threads is safe
+        self._frames = weakref.WeakKeyDictionary()
+        # Reused dx/dy scratch, grown on demand; one pair per thread so an evaluator
+        # can be shared across threads
+        self._scratch = threading.local()
+
+    def _scratch_buffers(self, n: int) -> Tuple[np.ndarray, np.ndarray]:
+        """Return this thread's dx/dy scratch buffers, at least n samples long"""
+        scratch = self._scratch
+        if getattr(scratch, "dx", None) is None or scratch.dx.shape[0] < n:
+            size = max(n, self.config.MAX_BUFFER_SIZE - 1)
+            scratch.dx = np.empty(size, dtype=np.float32)
+            scratch.dy = np.empty(size, dtype=np.float32)
+        return scratch.dx[:n], scratch.dy[:n]
+
+    def _frame(self, eye_tracking_data: EyeTrackingData) -> Frame:
+        """
+        Compute the derived quantities of eye tracking data once and memoize them.
+
+        Args:
+        - eye_tracking_data (EyeTrackingData): Eye tracking data containing x, y coordinates and timestamps.
+
+        Returns:
+        - frame (Frame): Velocity, time steps and coordinate means.
+        """
+        version = getattr(eye_tracking_data, "version", None)
+        if version is None:
+            # Without a version counter in-place updates can't be detected, so don't memoize
+            return self._compute_frame(eye_tracking_data)
+        try:
+            cached = self._frames.get(eye_tracking_data)
+        except TypeError:
+            # Data objects that can't be weak-keyed (unhashable or without
+            # __weakref__) are evaluated without memoization
+            return self._compute_frame(eye_tracking_data)
+        if cached is not None and cached[0] == version:
+            return cached[1]
+        frame = self._compute_frame(eye_tracking_data)
+        self._frames[eye_tracking_data] = (version, frame)
+        return frame
+
+    def _compute_frame(self, eye_tracking_data: EyeTrackingData) -> Frame:
+        """Compute the derived quantities of any object with x, y and timestamp sequences."""
+        x = np.asarray(eye_tracking_data.x, dtype=np.float32)
+        y = np.asarray(eye_tracking_data.y, dtype=np.float32)
+        timestamp = np.asarray(eye_tracking_data.timestamp, dtype=np.float64)
+        n = max(x.shape[0] - 1, 0)
+        dx, dy = self._scratch_buffers(n)
+        np.subtract(x[1:], x[:-1], out=dx)
+        np.subtract(y[1:], y[:-1], out=dy)
+        # dt and velocity are kept in the memoized frame, so they get their own storage
+        dt = np.diff(timestamp)
+        velocity = np.empty(n)
+        if ne is not None:
+            # One blocked, multithreaded pass instead of chained temporaries
+            ne.evaluate("sqrt(dx*dx + dy*dy) / dt", out=velocity)
+        else:
+            np.hypot(dx, dy, out=velocity)
+            np.divide(velocity, dt, out=velocity)
+        velocity.setflags(write=False)
+        dt.setflags(write=False)
+        return Frame(velocity, dt, float(x.mean()), float(y.mean()))
 
     def evaluate_attention(self, eye_tracking_data: EyeTrackingData) -> float:
         """
@@ -36,16 +137,15 @@ class PerformanceEvaluator:
         Returns:
         - attention_score (float): Attention score between 0 and 1.
         """
-        with self.lock:
-            try:
-                # Calculate velocity of eye movements
-                velocity = self.calculate_velocity(eye_tracking_data)
-                # Apply velocity threshold to detect attention
-                attention_score = self.apply_velocity_threshold(velocity)
-                return attention_score
-            except Exception as e:
-                self.logger.error(f"Error evaluating attention: {e}")
-                return 0.0
+        try:
+            # Calculate velocity of eye movements
+            velocity = self.calculate_velocity(eye_tracking_data)
+            # Apply velocity threshold to detect attention
+            attention_score = self.apply_velocity_threshold(velocity)
+            return attention_score
+        except Exception as e:
+            self.logger.error("Error evaluating attention: %s", e)
+            return 0.0
 
     def assess_cognitive_load(self, eye_tracking_data: EyeTrackingData) -> float:
         """
@@ -57,16 +157,15 @@ class PerformanceEvaluator:
         Returns:
         - cognitive_load_score (float): Cognitive load score between 0 and 1.
         """
-        with self.lock:
-            try:
-                # Calculate pupillometry metrics
-                pupillometry_metrics = self.calculate_pupillometry_metrics(eye_tracking_data)
-                # Apply Flow Theory to assess cognitive load
-                cognitive_load_score = self.apply_flow_theory(pupillometry_metrics)
-                return cognitive_load_score
-            except Exception as e:
-                self.logger.error(f"Error assessing cognitive load: {e}")
-                return 0.0
+        try:
+            # Calculate pupillometry metrics
+            pupillometry_metrics = self.calculate_pupillometry_metrics(eye_tracking_data)
+            # Apply Flow Theory to assess cognitive load
+            cognitive_load_score = self.apply_flow_theory(pupillometry_metrics)
+            return cognitive_load_score
+        except Exception as e:
+            self.logger.error("Error assessing cognitive load: %s", e)
+            return 0.0
 
     def generate_performance_report(self, attention_score: float, cognitive_load_score: float) -> Dict[str, float]:
         """
@@ -79,18 +178,17 @@ class PerformanceEvaluator:
         Returns:
         - performance_report (Dict[str, float]): Performance report containing attention and cognitive load scores.
         """
-        with self.lock:
-            try:
-                performance_report = {
-                    "attention_score": attention_score,
-                    "cognitive_load_score": cognitive_load_score
-                }
-                return performance_report
-            except Exception as e:
-                self.logger.error(f"Error generating performance report: {e}")
-                return {}
+        try:
+            performance_report = {
+                "attention_score": attention_score,
+                "cognitive_load_score": cognitive_load_score
+            }
+            return performance_report
+        except Exception as e:
+            self.logger.error("Error generating performance report: %s", e)
+            return {}
 
-    def calculate_velocity(self, eye_tracking_data: EyeTrackingData) -> List[float]:
+    def calculate_velocity(self, eye_tracking_data: EyeTrackingData) -> np.ndarray:
         """
         Calculate velocity of eye movements.
 
@@ -98,38 +196,36 @@ class PerformanceEvaluator:
         - eye_tracking_data (EyeTrackingData): Eye tracking data containing x, y coordinates and timestamps.
 
         Returns:
-        - velocity (List[float]): Velocity of eye movements.
-        """
-        with self.lock:
-            try:
-                # Calculate differences in x and y coordinates
-                dx = np.diff(eye_tracking_data.x)
-                dy = np.diff(eye_tracking_data.y)
-                # Calculate velocity using Pythagorean theorem
-                velocity = np.sqrt(dx**2 + dy**2) / np.diff(eye_tracking_data.timestamp)
-                return velocity.tolist()
-            except Exception as e:
-                self.logger.error(f"Error calculating velocity: {e}")
-                return []
-
-    def apply_velocity_threshold(self, velocity: List[float]) -> float:
+        - velocity (np.ndarray): Velocity of eye movements (read-only; it is shared with the memoized frame).
+        """
+        # Velocity is the Euclidean step length over the time step
+        return self._frame(eye_tracking_data).velocity
+
+    def incremental_velocity(self, x0: float, y0: float, t0: float, x1: float, y1: float, t1: float) -> float:
+        """
+        Calculate the velocity for a single new sample, for online per-sample updates.
+
+        Args:
+        - x0, y0, t0 (float): Previous sample coordinates and timestamp.
+        - x1, y1, t1 (float): New sample coordinates and timestamp.
+
+        Returns:
+        - velocity (float): Velocity between the two samples.
+        """
+        return _sample_velocity(float(x0), float(y0), float(t0), float(x1), float(y1), float(t1))
+
+    def apply_velocity_threshold(self, velocity: np.ndarray) -> float:
         """
         Apply velocity threshold to detect attention.
 
         Args:
-        - velocity (List[float]): Velocity of eye movements.
+        - velocity (np.ndarray): Velocity of eye movements.
 
         Returns:
         - attention_score (float): Attention score between 0 and 1.
         """
-        with self.lock:
-            try:
-                # Calculate attention score based on velocity threshold
-                attention_score = np.mean([1 if v > self.config.VELOCITY_THRESHOLD else 0 for v in velocity])
-                return attention_score
-            except Exception as e:
-                self.logger.error(f"Error applying velocity threshold: {e}")
-                return 0.0
+        # Calculate attention score based on velocity threshold
+        return float((np.asarray(velocity) > self.config.VELOCITY_THRESHOLD).mean())
 
     def calculate_pupillometry_metrics(self, eye_tracking_data: EyeTrackingData) -> Dict[str, float]:
         """
@@ -141,17 +237,13 @@ class PerformanceEvaluator:
         Returns:
         - pupillometry_metrics (Dict[str, float]): Pupillometry metrics.
         """
-        with self.lock:
-            try:
-                # Calculate pupillometry metrics (e.g., pupil diameter, blink rate)
-                pupillometry_metrics = {
-                    "pupil_diameter": np.mean(eye_tracking_data.x),
-                    "blink_rate": np.mean(eye_tracking_data.y)
-                }
-                return pupillometry_metrics
-            except Exception as e:
-                self.logger.error(f"Error calculating pupillometry metrics: {e}")
-                return {}
+        # Calculate pupillometry metrics (e.g., pupil diameter, blink rate)
+        frame = self._frame(eye_tracking_data)
+        pupillometry_metrics = {
+            "pupil_diameter": frame.mean_x,
+            "blink_rate": frame.mean_y
+        }
+        return pupillometry_metrics
 
     def apply_flow_theory(self, pupillometry_metrics: Dict[str, float]) -> float:
         """
@@ -163,14 +255,16 @@ class PerformanceEvaluator:
         Returns:
         - cognitive_load_score (float): Cognitive load score between 0 and 1.
         """
-        with self.lock:
-            try:
-                # Calculate cognitive load score based on Flow Theory
-                cognitive_load_score = (pupillometry_metrics["pupil_diameter"] / self.config.FLOW_THEORY_THRESHOLD) * (1 - (pupillometry_metrics["blink_rate"] / self.config.FLOW_THEORY_THRESHOLD))
-                return cognitive_load_score
-            except Exception as e:
-                self.logger.error(f"Error applying Flow Theory: {e}")
-                return 0.0
+        # Calculate cognitive load score based on Flow Theory
+        pupil = pupillometry_metrics["pupil_diameter"]
+        blink = pupillometry_metrics["blink_rate"]
+        thr = self.config.FLOW_THEORY_THRESHOLD
+        if ne is not None and np.ndim(pupil) + np.ndim(blink) > 0:
+            # Array inputs (e.g. offline replay) are evaluated in one fused pass
+            cognitive_load_score = ne.evaluate("(pupil / thr) * (1 - blink / thr)")
+        else:
+            cognitive_load_score = (pupil / thr) * (1 - (blink / thr))
+        return cognitive_load_score
 
 class PerformanceEvaluatorException(Exception):
     pass
@@ -1,5 +1,5 @@
 import numpy as np
-from scipy import signal
+from scipy import ndimage, signal
 import matplotlib.pyplot as plt
 import logging
 import json
@@ -9,6 +9,16 @@ from enum import Enum
 from dataclasses import dataclass
 from scipy.stats import norm
 
+try:
+    from joblib import Parallel, delayed
+except ImportError:
+    Parallel = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Set up logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
@@ -20,14 +30,73 @@ DEFAULT_CONFIG = {
     'cognitive_load_threshold': 0.5,
     'filter_order': 4,
     'filter_cutoff': 0.1,
+    'filter_method': 'butter',  # 'butter' (Butterworth filtfilt) or 'fir' (faster zero-phase FIR convolution; results differ slightly)
+    'fir_numtaps': 31,
+    'sample_rate': None,  # Hz; estimated from the timestamps when not set
     'plotting_enabled': True
 }
 
+FILTER_CACHE_SIZE = 16
+
+# Record layout of raw pupil samples on ingest
+PUPIL_DTYPE = np.dtype([('timestamp', 'f8'), ('diameter', 'f8')])
+
 @dataclass
-class PupilData:
-    """Data class for pupil diameter data"""
-    timestamp: float
-    diameter: float
+class PupilSeries:
+    """Pupil diameter samples stored as contiguous timestamp and diameter arrays"""
+    timestamps: np.ndarray
+    diameters: np.ndarray
+
+    def __post_init__(self):
+        self.timestamps = np.ascontiguousarray(self.timestamps, dtype=np.float64)
+        self.diameters = np.ascontiguousarray(self.diameters, dtype=np.float64)
+
+    def __len__(self) -> int:
+        return self.diameters.shape[0]
+
+# Suffix of the optional parsed-sample cache written next to a pupil data file
+PUPIL_CACHE_SUFFIX = '.pupil-cache.npz'
+
+def _read_pupil_cache(cache_path: str, source: np.ndarray):
+    """Return the cached samples if the cache is well-formed and was built from source, else None"""
+    try:
+        with np.load(cache_path) as cache:
+            if not np.array_equal(cache['source'], source):
+                return None
+            samples = cache['samples']
+    except (OSError, KeyError, ValueError) as e:
+        logger.warning(f'Ignoring unreadable pupil data cache {cache_path}: {e}')
+        return None
+    if samples.dtype != PUPIL_DTYPE or samples.ndim != 1:
+        return None
+    return samples
+
+def load_pupil_data(path: str, cache: bool = False) -> PupilSeries:
+    """
+    Load pupil samples from a JSON list of {timestamp, diameter} records.
+
+    With cache=True the parsed samples are also stored in <path>.pupil-cache.npz,
+    together with the size and modification time of the JSON file, and reused on
+    later loads while both still match.
+    """
+    cache_path = path + PUPIL_CACHE_SUFFIX
+    stat = os.stat(path)
+    source = np.array([stat.st_size, stat.st_mtime_ns], dtype=np.int64)
+    samples = _read_pupil_cache(cache_path, source) if cache and os.path.exists(cache_path) else None
+    if samples is None:
+        with open(path, 'rb') as f:
+            raw = orjson.loads(f.read()) if orjson is not None else json.load(f)
+        samples = np.fromiter(((data['timestamp'], data['diameter']) for data in raw), dtype=PUPIL_DTYPE, count=len(raw))
+        if cache:
+            try:
+                # Write to a temporary name first so a partial cache is never read
+                tmp_path = cache_path + '.tmp'
+                with open(tmp_path, 'wb') as f:
+                    np.savez(f, samples=samples, source=source)
+                os.replace(tmp_path, cache_path)
+            except OSError as e:
+                logger.warning(f'Could not write pupil data cache {cache_path}: {e}')
+    return PupilSeries(samples['timestamp'], samples['diameter'])
 
 class CognitiveLoad(Enum):
     """Enum for cognitive load levels"""
@@ -35,12 +104,57 @@ class CognitiveLoad(Enum):
     MEDIUM = 2
     HIGH = 3
 
+def _cached_filter(cache: Dict, key: Tuple, design) -> np.ndarray:
+    """Return the filter designed for key, designing it on a miss"""
+    coefficients = cache.get(key)
+    if coefficients is None:
+        # Estimated sample rates vary slightly between recordings; keep the cache bounded
+        if len(cache) >= FILTER_CACHE_SIZE:
+            cache.clear()
+        coefficients = cache[key] = design()
+    return coefficients
+
+def _filter_diameters(pupil_data: PupilSeries, config: Dict, cache: Dict) -> np.ndarray:
+    """Low-pass the diameters of a non-empty series as configured"""
+    time_array = pupil_data.timestamps
+    signal_array = pupil_data.diameters
+
+    sample_rate = config['sample_rate']
+    if not sample_rate:
+        sample_rate = (len(time_array) - 1) / (time_array[-1] - time_array[0])
+    nyq = 0.5 * sample_rate
+    wn = config['filter_cutoff'] / nyq
+
+    if config['filter_method'] == 'fir':
+        # A symmetric, odd-length FIR applied centred is zero-phase in a single C pass
+        taps = _cached_filter(cache, ('fir', config['fir_numtaps'], wn),
+                              lambda: signal.firwin(config['fir_numtaps'], wn))
+        return ndimage.convolve1d(signal_array, taps, mode='nearest')
+
+    # Design a Butterworth filter as second-order sections, once per parameter set
+    sos = _cached_filter(cache, ('butter', config['filter_order'], wn),
+                         lambda: signal.butter(config['filter_order'], wn, btype='low', output='sos'))
+
+    # Filter the signal
+    return signal.sosfiltfilt(sos, signal_array)
+
+# Per-process filter cache for batch workers
+_WORKER_FILTER_CACHE = {}
+
+def _analyze_one(pupil_data: PupilSeries, config: Dict) -> float:
+    """Average filtered dilation factor of one trial; a pure function so it can run in a worker"""
+    if not len(pupil_data):
+        return 0.0
+    return float(_filter_diameters(pupil_data, config, _WORKER_FILTER_CACHE).mean())
+
 class PupillometryAnalyzer:
     """Main class for pupillometry analysis"""
     def __init__(self, config_file: str = CONFIG_FILE):
         self.config = self.load_config(config_file)
-        self.pupil_data = []
-        self.filtered_data = []
+        self.pupil_data = PupilSeries(np.empty(0), np.empty(0))
+        self.filtered_data = PupilSeries(np.empty(0), np.empty(0))
+        # Designed filters keyed by their parameters, so repeated calls skip the design
+        self._filter_cache = {}
 
     def load_config(self, config_file: str) -> Dict:
         """Load configuration from file"""
@@ -52,23 +166,17 @@ class PupillometryAnalyzer:
             logger.warning(f'Config file not found: {config_file}')
             return DEFAULT_CONFIG
 
-    def analyze_pupil_dilation(self, pupil_data: List[PupilData]) -> float:
+    def analyze_pupil_dilation(self, pupil_data: PupilSeries) -> float:
         """Analyze pupil dilation and return the average dilation factor"""
-        if not pupil_data:
+        if not len(pupil_data):
             logger.error('No pupil data available')
             return 0.0
 
-        # Calculate dilation factor
-        dilation_factors = [data.diameter for data in pupil_data]
-        avg_dilation_factor = np.mean(dilation_factors)
-
-        # Filter data using a Butterworth filter
+        # Low-pass filter the data as configured (Butterworth by default)
         self.filtered_data = self.filter_data(pupil_data)
 
         # Calculate the average dilation factor of the filtered data
-        avg_filtered_dilation_factor = np.mean([data.diameter for data in self.filtered_data])
-
-        return avg_filtered_dilation_factor
+        return float(self.filtered_data.diameters.mean())
 
     def calculate_cognitive_load(self, dilation_factor: float) -> CognitiveLoad:
         """Calculate cognitive load based on the dilation factor"""
@@ -79,48 +187,30 @@ class PupillometryAnalyzer:
         else:
             return CognitiveLoad.HIGH
 
-    def filter_data(self, pupil_data: List[PupilData]) -> List[PupilData]:
-        """Filter pupil data using a Butterworth filter"""
-        if not pupil_data:
+    def filter_data(self, pupil_data: PupilSeries) -> PupilSeries:
+        """Filter pupil data using the configured low-pass filter (Butterworth by default, or FIR)"""
+        if not len(pupil_data):
             logger.error('No pupil data available')
-            return []
-
-        # Create a time array
-        time_array = np.array([data.timestamp for data in pupil_data])
-
-        # Create a signal array
-        signal_array = np.array([data.diameter for data in pupil_data])
-
-        # Design a Butterworth filter
-        nyq = 0.5 / (time_array[-1] - time_array[0])
-        b, a = signal.butter(self.config['filter_order'], self.config['filter_cutoff'] / nyq, btype='low')
+            return PupilSeries(np.empty(0), np.empty(0))
 
-        # Filter the signal
-        filtered_signal = signal.filtfilt(b, a, signal_array)
+        # The filtered series shares the input timestamps
+        return PupilSeries(pupil_data.timestamps, _filter_diameters(pupil_data, self.config, self._filter_cache))
 
-        # Create a new list of PupilData objects with the filtered data
-        filtered_data = [PupilData(data.timestamp, filtered_signal[i]) for i, data in enumerate(pupil_data)]
+    def analyze_batch(self, trials: List[PupilSeries]) -> List[float]:
+        """Filter and analyze many trials in parallel, returning each trial's average dilation factor"""
+        if Parallel is None:
+            return [_analyze_one(series, self.config) for series in trials]
+        return Parallel(n_jobs=-1, batch_size='auto')(delayed(_analyze_one)(series, self.config) for series in trials)
 
-        return filtered_data
-
-    def plot_data(self, pupil_data: List[PupilData], filtered_data: List[PupilData]) -> None:
+    def plot_data(self, pupil_data: PupilSeries, filtered_data: PupilSeries) -> None:
         """Plot the pupil data and filtered data"""
-        if not pupil_data:
+        if not len(pupil_data):
             logger.error('No pupil data available')
             return
 
-        # Create a time array
-        time_array = np.array([data.timestamp for data in pupil_data])
-
-        # Create a signal array
-        signal_array = np.array([data.diameter for data in pupil_data])
-
-        # Create a filtered signal array
-        filtered_signal_array = np.array([data.diameter for data in filtered_data])
-
         # Plot the data
-        plt.plot(time_array, signal_array, label='Original Data')
-        plt.plot(time_array, filtered_signal_array, label='Filtered Data')
+        plt.plot(pupil_data.timestamps, pupil_data.diameters, label='Original Data')
+        plt.plot(pupil_data.timestamps, filtered_data.diameters, label='Filtered Data')
         plt.legend()
         plt.show()
 
@@ -130,9 +220,7 @@ def main() -> None:
 
     # Load pupil data from file
     try:
-        with open('pupil_data.json', 'r') as f:
-            pupil_data = json.load(f)
-            pupil_data = [PupilData(data['timestamp'], data['diameter']) for data in pupil_data]
+        pupil_data = load_pupil_data('pupil_data.json')
     except FileNotFoundError:
         logger.error('Pupil data file not found')
         return
@@ -10,10 +10,106 @@ from saccade_fixation_detector.exceptions import InvalidInputError, Configuratio
 from saccade_fixation_detector.models import Saccade, Fixation
 from saccade_fixation_detector.utils import calculate_mean, calculate_std
 
+try:
+    import numba
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
 # Set up logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+if NUMBA_AVAILABLE:
+    @numba.njit(cache=True)
+    def _onepole(x, c):
+        """One-pole IIR low-pass y[i] = x[i] + c * y[i-1], as a native scalar recursion"""
+        y = np.empty_like(x)
+        acc = 0.0
+        for i in range(x.shape[0]):
+            acc = x[i] + c * acc
+            y[i] = acc
+        return y
+
+    @numba.njit(cache=True)
+    def _segment_runs(v, thr, above):
+        """Single pass over v emitting (start, end) of each run above (or below) thr; same rules as _runs"""
+        n = v.shape[0]
+        starts = np.empty(n // 2 + 1, dtype=np.int64)
+        ends = np.empty(n // 2 + 1, dtype=np.int64)
+        count = 0
+        i = 0
+        while i < n:
+            if (v[i] > thr) if above else (v[i] < thr):
+                j = i + 1
+                while j < n and ((v[j] > thr) if above else (v[j] < thr)):
+                    j += 1
+                if j > 1:
+                    starts[count] = max(i - 1, 0)
+                    ends[count] = j
+                    count += 1
+                i = j
+            else:
+                i += 1
+        return starts[:count], ends[:count]
+
+    @numba.njit(cache=True)
+    def _fused_detect(pos, c, fs, saccade_thr, fixation_thr):
+        """
+        One pass over (N, 2) float32 positions: speed, one-pole low-pass (accumulated
+        in float64), abs, and both threshold run scans; same run rules as _runs.
+        Only the absolute filtered velocities and the run bounds are written.
+        """
+        n = max(pos.shape[0] - 1, 0)
+        absv = np.empty(n)
+        s_starts = np.empty(n // 2 + 1, dtype=np.int64)
+        s_ends = np.empty(n // 2 + 1, dtype=np.int64)
+        f_starts = np.empty(n // 2 + 1, dtype=np.int64)
+        f_ends = np.empty(n // 2 + 1, dtype=np.int64)
+        s_count = 0
+        f_count = 0
+        s_open = -1
+        f_open = -1
+        acc = 0.0
+        for i in range(n):
+            dx = pos[i + 1, 0] - pos[i, 0]
+            dy = pos[i + 1, 1] - pos[i, 1]
+            acc = math.sqrt(dx * dx + dy * dy) * fs + c * acc
+            v = abs(acc)
+            absv[i] = v
+            if v > saccade_thr:
+                if s_open < 0:
+                    s_open = i
+            elif s_open >= 0:
+                if i > 1:
+                    s_starts[s_count] = max(s_open - 1, 0)
+                    s_ends[s_count] = i
+                    s_count += 1
+                s_open = -1
+            if v < fixation_thr:
+                if f_open < 0:
+                    f_open = i
+            elif f_open >= 0:
+                if i > 1:
+                    f_starts[f_count] = max(f_open - 1, 0)
+                    f_ends[f_count] = i
+                    f_count += 1
+                f_open = -1
+        if s_open >= 0 and n > 1:
+            s_starts[s_count] = max(s_open - 1, 0)
+            s_ends[s_count] = n
+            s_count += 1
+        if f_open >= 0 and n > 1:
+            f_starts[f_count] = max(f_open - 1, 0)
+            f_ends[f_count] = n
+            f_count += 1
+        return absv, s_starts[:s_count], s_ends[:s_count], f_starts[:f_count], f_ends[:f_count]
+
+    # Warm-compile at import so the first real call doesn't pay JIT latency
+    _onepole(np.zeros(2), 0.5)
+    _segment_runs(np.zeros(2), 0.5, True)
+    _fused_detect(np.zeros((2, 2), dtype=np.float32), 0.5, 1.0, 0.5, 0.5)
+
 class SaccadeFixationDetector:
     """
     Velocity-threshold identification algorithm for detecting saccades and fixations.
@@ -32,94 +128,111 @@ class SaccadeFixationDetector:
         self.saccades = []
         self.fixations = []
 
-    def calculate_angular_velocity(self, eye_positions: List[List[float]]) -> List[float]:
+    def calculate_angular_velocity(self, eye_positions: List[List[float]]) -> np.ndarray:
         """
         Calculate the angular velocity of the eye movements.
 
         Args:
-            eye_positions (List[List[float]]): A list of eye positions.
+            eye_positions (List[List[float]]): A list of eye positions in degrees of visual angle.
 
         Returns:
-            List[float]: A list of angular velocities.
+            np.ndarray: The angular velocities in degrees per second, one per consecutive pair of positions.
         """
         try:
-            # Calculate the differences in x and y coordinates
-            dx = np.diff([pos[0] for pos in eye_positions])
-            dy = np.diff([pos[1] for pos in eye_positions])
-
-            # Calculate the angular velocities
-            angular_velocities = np.arctan2(dy, dx)
+            positions = np.asarray(eye_positions, dtype=np.float32).reshape(-1, 2)
+            if positions.shape[0] < 2:
+                return np.empty(0, dtype=np.float32)
 
-            # Convert the angular velocities to radians per second
-            angular_velocities = np.deg2rad(angular_velocities) / self.config.sample_rate
+            # Differences in x and y coordinates, computed on an (N, 2) array in one pass
+            diffs = np.diff(positions, axis=0)
 
-            return angular_velocities.tolist()
+            # I-VT point-to-point speed: displacement magnitude per sample, scaled by the sample rate
+            return np.hypot(diffs[:, 0], diffs[:, 1]) * self.config.sample_rate
         except Exception as e:
             logger.error(f"Error calculating angular velocity: {str(e)}")
             raise
 
-    def detect_saccades(self, angular_velocities: List[float]) -> List[Saccade]:
+    def absolute_filtered_velocities(self, angular_velocities: np.ndarray) -> np.ndarray:
         """
-        Detect saccades based on the angular velocities.
+        Low-pass filter the angular velocities and take their absolute values.
 
         Args:
-            angular_velocities (List[float]): A list of angular velocities.
+            angular_velocities (np.ndarray): The angular velocities.
 
         Returns:
-            List[Saccade]: A list of detected saccades.
+            np.ndarray: The absolute filtered velocities.
         """
-        try:
-            # Apply a low-pass filter to the angular velocities
+        # Apply a low-pass filter to the angular velocities
+        if NUMBA_AVAILABLE:
+            filtered_velocities = _onepole(np.ascontiguousarray(angular_velocities, dtype=np.float64),
+                                           float(self.config.low_pass_filter_coefficient))
+        else:
             filtered_velocities = signal.lfilter([1], [1, -self.config.low_pass_filter_coefficient], angular_velocities)
 
-            # Calculate the absolute values of the filtered velocities
-            absolute_velocities = np.abs(filtered_velocities)
-
-            # Detect saccades based on the absolute velocities
-            saccades = []
-            for i in range(1, len(absolute_velocities)):
-                if absolute_velocities[i] > self.config.saccade_threshold:
-                    saccade_start = i - 1
-                    saccade_end = i
-                    while saccade_end < len(absolute_velocities) and absolute_velocities[saccade_end] > self.config.saccade_threshold:
-                        saccade_end += 1
-                    saccade = Saccade(saccade_start, saccade_end, absolute_velocities[saccade_start:saccade_end])
-                    saccades.append(saccade)
-
-            return saccades
+        # Calculate the absolute values of the filtered velocities
+        return np.abs(filtered_velocities)
+
+    @staticmethod
+    def _runs(absolute_velocities: np.ndarray, threshold: float, above: bool):
+        """
+        Find the contiguous runs of velocities above (or below) a threshold.
+
+        Each run is reported starting one sample before its first sample, and runs
+        ending at index 1 or earlier are skipped, matching the original sample-by-sample scan.
+
+        Args:
+            absolute_velocities (np.ndarray): The absolute filtered velocities.
+            threshold (float): The velocity threshold.
+            above (bool): Whether runs are above (saccades) or below (fixations) the threshold.
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray]: Start and (exclusive) end index of each run.
+        """
+        if NUMBA_AVAILABLE:
+            # Threshold and run detection fused into one pass, without a mask
+            return _segment_runs(absolute_velocities, float(threshold), above)
+        mask = absolute_velocities > threshold if above else absolute_velocities < threshold
+        edges = np.diff(mask.astype(np.int8), prepend=0, append=0)
+        starts = np.flatnonzero(edges == 1)
+        ends = np.flatnonzero(edges == -1)
+        keep = ends > 1
+        return np.maximum(starts[keep] - 1, 0), ends[keep]
+
+    @staticmethod
+    def _events(event_type: type, absolute_velocities: np.ndarray, starts: np.ndarray, ends: np.ndarray) -> List:
+        """Build event_type (Saccade or Fixation) objects from run bounds."""
+        return [event_type(start, end, absolute_velocities[start:end]) for start, end in zip(starts.tolist(), ends.tolist())]
+
+    def detect_saccades(self, absolute_velocities: np.ndarray) -> List[Saccade]:
+        """
+        Detect saccades as runs of absolute filtered velocity above the saccade threshold.
+
+        Args:
+            absolute_velocities (np.ndarray): The output of absolute_filtered_velocities.
+
+        Returns:
+            List[Saccade]: A list of detected saccades.
+        """
+        try:
+            starts, ends = self._runs(absolute_velocities, self.config.saccade_threshold, True)
+            return self._events(Saccade, absolute_velocities, starts, ends)
         except Exception as e:
             logger.error(f"Error detecting saccades: {str(e)}")
             raise
 
-    def detect_fixations(self, angular_velocities: List[float]) -> List[Fixation]:
+    def detect_fixations(self, absolute_velocities: np.ndarray) -> List[Fixation]:
         """
-        Detect fixations based on the angular velocities.
+        Detect fixations as runs of absolute filtered velocity below the fixation threshold.
 
         Args:
-            angular_velocities (List[float]): A list of angular velocities.
+            absolute_velocities (np.ndarray): The output of absolute_filtered_velocities.
 
         Returns:
             List[Fixation]: A list of detected fixations.
         """
         try:
-            # Apply a low-pass filter to the angular velocities
-            filtered_velocities = signal.lfilter([1], [1, -self.config.low_pass_filter_coefficient], angular_velocities)
-
-            # Calculate the absolute values of the filtered velocities
-            absolute_velocities = np.abs(filtered_velocities)
-
-            # Detect fixations based on the absolute velocities
-            fixations = []
-            for i in range(1, len(absolute_velocities)):
-                if absolute_velocities[i] < self.config.fixation_threshold:
-                    fixation_start = i - 1
-                    fixation_end = i
-                    while fixation_end < len(absolute_velocities) and absolute_velocities[fixation_end] < self.config.fixation_threshold:
-                        fixation_end += 1
-                    fixation = Fixation(fixation_start, fixation_end, absolute_velocities[fixation_start:fixation_end])
-                    fixations.append(fixation)
-
-            return fixations
+            starts, ends = self._runs(absolute_velocities, self.config.fixation_threshold, False)
+            return self._events(Fixation, absolute_velocities, starts, ends)
         except Exception as e:
             logger.error(f"Error detecting fixations: {str(e)}")
             raise
@@ -135,14 +248,26 @@ class SaccadeFixationDetector:
             Dict[str, List]: A dictionary containing the detected saccades and fixations.
         """
         try:
+            positions = np.ascontiguousarray(eye_positions, dtype=np.float32).reshape(-1, 2)
+            if NUMBA_AVAILABLE:
+                # Velocity, filter, threshold and run detection fused into one pass
+                absolute_velocities, sacc_starts, sacc_ends, fix_starts, fix_ends = _fused_detect(
+                    positions, float(self.config.low_pass_filter_coefficient), float(self.config.sample_rate),
+                    float(self.config.saccade_threshold), float(self.config.fixation_threshold))
+                return {"saccades": self._events(Saccade, absolute_velocities, sacc_starts, sacc_ends),
+                        "fixations": self._events(Fixation, absolute_velocities, fix_starts, fix_ends)}
+
             # Calculate the angular velocities
-            angular_velocities = self.calculate_angular_velocity(eye_positions)
+            angular_velocities = self.calculate_angular_velocity(positions)
+
+            # Filter once and share the result between both detectors
+            absolute_velocities = self.absolute_filtered_velocities(angular_velocities)
 
             # Detect saccades
-            saccades = self.detect_saccades(angular_velocities)
+            saccades = self.detect_saccades(absolute_velocities)
 
             # Detect fixations
-            fixations = self.detect_fixations(angular_velocities)
+            fixations = self.detect_fixations(absolute_velocities)
 
             return {"saccades": saccades, "fixations": fixations}
         except Exception as e:
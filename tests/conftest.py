@@ -0,0 +1,18 @@
+import importlib
+import sys
+import types
+
+import pytest
+
+
+@pytest.fixture
+def load_module(monkeypatch):
+    """Import a flat repo module, registering stand-ins for imports that are not in this tree"""
+    def load(name, fakes=None):
+        for module_name, attrs in (fakes or {}).items():
+            module = types.ModuleType(module_name)
+            module.__dict__.update(attrs)
+            monkeypatch.setitem(sys.modules, module_name, module)
+        monkeypatch.delitem(sys.modules, name, raising=False)
+        return importlib.import_module(name)
+    return load
@@ -0,0 +1,38 @@
+import asyncio
+import itertools
+
+import pytest
+
+
+@pytest.fixture
+def bc(load_module, tmp_path, monkeypatch):
+    # The module logs to a file in the working directory
+    monkeypatch.chdir(tmp_path)
+    return load_module("biofeedback_controller")
+
+
+def branchy_signal(bc, current, velocity, flow, velocity_threshold, flow_threshold):
+    """The original two-if update, which the table lookup replaces"""
+    signal = current
+    if velocity > velocity_threshold:
+        signal = bc.AdaptationSignal.VELOCITY_THRESHOLD
+    if flow > flow_threshold:
+        signal = bc.AdaptationSignal.FLOW_THEORY
+    return signal
+
+
+def test_select_adaptation_signal_matches_branches(bc):
+    controller = bc.BiofeedbackController({"velocity_threshold": 0.5, "flow_threshold": 0.7})
+    for current, velocity, flow in itertools.product(bc.AdaptationSignal, (0.0, 0.5, 0.6), (0.0, 0.7, 0.8)):
+        controller.user_state = bc.UserState(0.0, 0.0, current)
+        assert controller.select_adaptation_signal(velocity, flow) == branchy_signal(bc, current, velocity, flow, 0.5, 0.7)
+
+
+def test_missing_thresholds_fall_back_to_defaults(bc):
+    controller = bc.BiofeedbackController({})
+    assert controller.velocity_threshold == bc.DEFAULT_VELOCITY_THRESHOLD
+    assert controller.flow_threshold == bc.DEFAULT_FLOW_THRESHOLD
+
+
+def test_run_without_config_file(bc):
+    asyncio.run(bc.run())
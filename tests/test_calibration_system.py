@@ -0,0 +1,63 @@
+import numpy as np
+import pytest
+
+
+class FakeEye:
+    """Per-point SDK calls over scripted calibration points on a 1920x1080 screen"""
+    def __init__(self, points=()):
+        self.points = list(points)
+        self.index = 0
+
+    def start_calibration(self):
+        pass
+
+    def end_calibration(self):
+        pass
+
+    def get_calibration_point(self):
+        return self.points[self.index]
+
+    def move_to_next_calibration_point(self):
+        self.index += 1
+
+    def get_screen_width(self):
+        return 1920
+
+    def get_screen_height(self):
+        return 1080
+
+
+@pytest.fixture
+def cs(load_module):
+    return load_module("calibration_system", {"sranipal_api": {"SRanipal_Eye": FakeEye}})
+
+
+POINTS = [(960, 540), (0, 0), (1920, 0), (0, 1080), (1920, 1080)]
+
+
+@pytest.mark.parametrize("points, valid", [
+    (POINTS, True),
+    ([(960, 540), (0, 0), (1921, 0), (0, 1080), (1920, 1080)], False),
+    ([(960, 540), (0, -1), (1920, 0), (0, 1080), (1920, 1080)], False),
+    ([(960, 540), (0, 0), (1920, 0), (0, 1081), (1920, 1080)], False),
+    (POINTS[:4], False),
+], ids=["in-bounds", "x-over", "y-negative", "y-over", "too-few"])
+def test_validate_calibration_bounds(cs, points, valid):
+    system = cs.EyeCalibrationSystem(FakeEye())
+    system.calibration_points = np.array(points, dtype=np.int32).reshape(-1, 2)
+    assert system.validate_calibration() is valid
+
+
+def test_bulk_collection_matches_per_point_collection(cs):
+    per_point = cs.EyeCalibrationSystem(FakeEye(POINTS))
+    per_point.run_calibration()
+
+    bulk_eye = FakeEye()
+    bulk_eye.run_calibration_collect = lambda n: POINTS[:n]
+    bulk = cs.EyeCalibrationSystem(bulk_eye)
+    bulk.run_calibration()
+
+    np.testing.assert_array_equal(bulk.calibration_points, per_point.calibration_points)
+    assert bulk.calibration_points.dtype == per_point.calibration_points.dtype == np.int32
+    assert bulk.calibration_status == per_point.calibration_status == cs.CalibrationStatus.CALIBRATED
+    assert bulk.validate_calibration() and per_point.validate_calibration()
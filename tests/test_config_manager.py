@@ -0,0 +1,91 @@
+import json
+import os
+
+import pytest
+
+import config_manager as cm
+
+
+@pytest.fixture
+def parses(monkeypatch):
+    """Count how often the file contents are actually parsed"""
+    calls = []
+    loads = cm._loads
+
+    def counting_loads(raw):
+        calls.append(1)
+        return loads(raw)
+    monkeypatch.setattr(cm, "_loads", counting_loads)
+    return calls
+
+
+def write(path, config):
+    path.write_text(json.dumps(config))
+
+
+def test_unchanged_file_is_parsed_once(tmp_path, parses):
+    path = tmp_path / "config.json"
+    write(path, {"a": 1})
+    first = cm.ConfigManager.read_config_file(str(path))
+    first["a"] = 2
+    assert cm.ConfigManager.read_config_file(str(path)) == {"a": 1}
+    assert len(parses) == 1
+
+
+def test_rewrite_with_the_same_mtime_is_reparsed(tmp_path, parses):
+    path = tmp_path / "config.json"
+    write(path, {"a": 1})
+    stat = os.stat(path)
+    assert cm.ConfigManager.read_config_file(str(path)) == {"a": 1}
+    write(path, {"a": 100})
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+    assert cm.ConfigManager.read_config_file(str(path)) == {"a": 100}
+    assert len(parses) == 2
+
+
+def test_replaced_file_is_reparsed(tmp_path):
+    path = tmp_path / "config.json"
+    write(path, {"a": 1})
+    stat = os.stat(path)
+    assert cm.ConfigManager.read_config_file(str(path)) == {"a": 1}
+    # Same size and mtime, new inode: an atomic replace by an editor or deploy tool
+    replacement = tmp_path / "config.json.tmp"
+    write(replacement, {"a": 2})
+    os.utime(replacement, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+    os.replace(replacement, path)
+    assert cm.ConfigManager.read_config_file(str(path)) == {"a": 2}
+
+
+def test_empty_file_is_a_decode_error_and_recovers(tmp_path):
+    path = tmp_path / "config.json"
+    path.write_bytes(b"")
+    with pytest.raises(json.JSONDecodeError):
+        cm.ConfigManager.read_config_file(str(path))
+    write(path, {"a": 1})
+    assert cm.ConfigManager.read_config_file(str(path)) == {"a": 1}
+
+
+@pytest.fixture
+def manager(tmp_path):
+    return cm.ConfigManager(str(tmp_path / "config.json"))
+
+
+def test_default_config_is_valid(manager):
+    manager.validate_parameters(manager.get_config())
+
+
+@pytest.mark.parametrize("edit, message", [
+    (lambda c: c["eye_tracking"].pop("velocity_threshold"), "Missing required parameter: velocity_threshold"),
+    (lambda c: c["eye_tracking"]["saccade_detection"].pop("min_duration"), "Missing required parameter: min_duration"),
+    (lambda c: c["eye_tracking"].update(velocity_threshold="fast"), "Invalid parameter value"),
+    (lambda c: c["eye_tracking"].update(fixation_detection=[0.8, 200, 1000]), "Invalid parameter value"),
+    (lambda c: c["eye_tracking"]["fixation_detection"].update(min_duration=None), "Invalid parameter value"),
+    (lambda c: c["eye_tracking"].update(velocity_threshold=1.5), "velocity_threshold must be at most 1"),
+    (lambda c: c["eye_tracking"]["saccade_detection"].update(min_duration=-1), "min_duration must be at least 0"),
+    (lambda c: c["eye_tracking"]["saccade_detection"].update(min_duration=600), "min_duration must be less than or equal to max_duration"),
+], ids=["missing", "missing-nested", "wrong-type", "wrong-section-type", "none", "above-range", "below-range", "min-over-max"])
+def test_invalid_configs_are_rejected(manager, edit, message):
+    config = manager.get_config()
+    edit(config)
+    with pytest.raises(ValueError, match=message):
+        manager.validate_parameters(config)
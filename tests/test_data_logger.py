@@ -0,0 +1,53 @@
+import threading
+
+import pandas as pd
+import pytest
+
+import data_logger
+
+EYE = [{"timestamp": 1700000000.5 + i, "x": 10.0 + i, "y": 20.0, "velocity": 5.25 * i} for i in range(3)]
+PHYS = [{"timestamp": 1700000000.75 + i, "heart_rate": 60.0 + i, "skin_conductance": 10.0} for i in range(2)]
+
+
+@pytest.fixture
+def logger(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    instance = data_logger.DataLogger({})
+    yield instance
+    instance.stop()
+
+
+def test_export_matches_row_wise_dataframe(logger, tmp_path):
+    for row in EYE:
+        logger.log_eye_data(row)
+    for row in PHYS:
+        logger.log_physiological_data(row)
+    logger.export_analysis_data()
+    expected = pd.DataFrame(EYE + PHYS).to_csv(index=False)
+    assert (tmp_path / data_logger.ANALYSIS_DATA_FILE).read_text() == expected
+
+
+def test_samples_logged_before_stop_are_saved(logger, tmp_path):
+    for row in EYE:
+        logger.log_eye_data(row)
+    logger.stop()
+    logger.save_session_data()
+    assert logger.session_data["eye_data"]["x"].tolist() == [row["x"] for row in EYE]
+
+
+def test_logging_after_stop_raises(logger):
+    logger.stop()
+    with pytest.raises(data_logger.DataLoggerException):
+        logger.log_eye_data(EYE[0])
+    with pytest.raises(data_logger.DataLoggerException):
+        logger.log_physiological_data(PHYS[0])
+
+
+def test_drain_marker_queued_behind_stop_does_not_hang(logger):
+    # The interleaving where stop() has queued _STOP but a concurrent save has
+    # already checked the closed flag and queues its drain marker behind it
+    logger._sample_q.put((data_logger._STOP, None))
+    waiter = threading.Thread(target=logger._wait_for_drain, daemon=True)
+    waiter.start()
+    waiter.join(timeout=5)
+    assert not waiter.is_alive()
@@ -0,0 +1,59 @@
+import numpy as np
+import pytest
+from scipy import signal
+
+import data_preprocessor as dp
+
+
+@pytest.fixture
+def preprocessor():
+    return dp.Preprocessor(dp.Config())
+
+
+def reference_pipeline(config, data):
+    """The stages as plain SciPy/NumPy calls"""
+    valid = data[(data >= dp.VALID_RANGE[0]) & (data <= dp.VALID_RANGE[1])]
+    sos = signal.butter(config.filter_order, config.filter_cutoff / (0.5 * config.sampling_rate), btype='low', output='sos')
+    smoothed = signal.sosfiltfilt(sos, signal.medfilt(valid, kernel_size=3))
+    smoothed[np.abs(smoothed) > config.spike_threshold] = 0.0
+    return smoothed
+
+
+def test_pipeline_matches_reference_with_and_without_numba(preprocessor, monkeypatch):
+    rng = np.random.default_rng(0)
+    data = rng.uniform(-0.2, 1.2, 2000)
+    expected = reference_pipeline(preprocessor.config, data)
+    np.testing.assert_allclose(preprocessor(data), expected, rtol=1e-9, atol=1e-12)
+    monkeypatch.setattr(dp, "NUMBA_AVAILABLE", False)
+    np.testing.assert_allclose(preprocessor(data), expected, rtol=1e-9, atol=1e-12)
+
+
+def test_pipeline_and_smooth_data_share_one_filter_design(preprocessor):
+    data = np.random.default_rng(1).uniform(0.0, 1.0, 1000)
+    staged = preprocessor.remove_spikes(preprocessor.smooth_data(preprocessor.median_filtering(data)))
+    np.testing.assert_allclose(preprocessor(data), staged, rtol=1e-9, atol=1e-12)
+
+
+@pytest.mark.parametrize("data", [np.arange(500), np.arange(1000).reshape(2, 500) % 37])
+def test_smooth_data_matches_sosfiltfilt(preprocessor, monkeypatch, data):
+    sos = dp._butter_sos(preprocessor.config.filter_order, preprocessor.config.filter_cutoff, preprocessor.config.sampling_rate)
+    expected = signal.sosfiltfilt(sos, data.astype(np.float64), axis=-1)
+    np.testing.assert_allclose(preprocessor.smooth_data(data), expected, rtol=1e-9, atol=1e-9)
+    monkeypatch.setattr(dp, "NUMBA_AVAILABLE", False)
+    np.testing.assert_allclose(preprocessor.smooth_data(data), expected, rtol=1e-9, atol=1e-9)
+
+
+def test_remove_invalid_samples_matches_mask(preprocessor, monkeypatch):
+    data = np.random.default_rng(2).uniform(-1.0, 2.0, 300)
+    expected = data[(data >= 0.0) & (data <= 1.0)]
+    np.testing.assert_array_equal(preprocessor.remove_invalid_samples(data), expected)
+    monkeypatch.setattr(dp, "NUMBA_AVAILABLE", False)
+    np.testing.assert_array_equal(preprocessor.remove_invalid_samples(data), expected)
+
+
+def test_smooth_data_propagates_nan_like_sosfiltfilt(preprocessor):
+    data = np.random.default_rng(3).uniform(0.0, 1.0, 500)
+    data[250] = np.nan
+    sos = dp._butter_sos(preprocessor.config.filter_order, preprocessor.config.filter_cutoff, preprocessor.config.sampling_rate)
+    expected = signal.sosfiltfilt(sos, data)
+    np.testing.assert_array_equal(np.isnan(preprocessor.smooth_data(data)), np.isnan(expected))
@@ -0,0 +1,71 @@
+import numpy as np
+import pytest
+
+import dynamic_difficulty_adjuster as dda
+
+
+@pytest.fixture
+def adjuster():
+    return dda.DynamicDifficultyAdjuster({})
+
+
+def scalar_states(adjuster, velocities, fixations):
+    return [adjuster.assess_user_state(dda.EyeTrackingMetrics(float(v), float(f))) for v, f in zip(velocities, fixations)]
+
+
+@pytest.mark.parametrize("dtype", [np.float64, np.float32, np.int64])
+def test_assess_batch_matches_scalar_assessment_with_and_without_numba(adjuster, monkeypatch, dtype):
+    rng = np.random.default_rng(0)
+    velocities = rng.uniform(0.0, 2.0, 1000).astype(dtype)
+    fixations = rng.uniform(0.0, 2.0, 1000).astype(dtype)
+    velocities[:3] = fixations[:3] = 0
+    if np.issubdtype(dtype, np.floating):
+        velocities[3] = np.nan
+    expected = scalar_states(adjuster, velocities, fixations)
+    assert adjuster.assess_batch(velocities, fixations).tolist() == expected
+    monkeypatch.setattr(dda, "NUMBA_AVAILABLE", False)
+    assert adjuster.assess_batch(velocities, fixations).tolist() == expected
+
+
+def test_assess_batch_empty_input(adjuster, monkeypatch):
+    assert adjuster.assess_batch(np.empty(0), np.empty(0)).shape == (0,)
+    monkeypatch.setattr(dda, "NUMBA_AVAILABLE", False)
+    assert adjuster.assess_batch(np.empty(0), np.empty(0)).shape == (0,)
+
+
+def test_inlined_assessment_matches_engagement_steps(adjuster):
+    for velocity in np.linspace(0.0, 2.0, 41):
+        metrics = dda.EyeTrackingMetrics(velocity, 0.4)
+        expected = adjuster.determine_flow_state(adjuster.calculate_engagement_level(metrics))
+        assert adjuster.assess_user_state(metrics) == expected
+
+
+def test_dict_metrics_match_dataclass_metrics(adjuster):
+    metrics = dda.EyeTrackingMetrics(0.9, 0.5)
+    assert adjuster.flow_state_detection(metrics.to_dict()) == adjuster.flow_state_detection(metrics)
+    assert adjuster.calculate_engagement_level(metrics.to_dict()) == adjuster.calculate_engagement_level(metrics)
+
+
+@pytest.mark.parametrize("method", ["assess_user_state", "flow_state_detection", "calculate_engagement_level"])
+def test_other_metric_types_raise_type_error(adjuster, method):
+    with pytest.raises(TypeError):
+        getattr(adjuster, method)((0.5, 0.3))
+
+
+@pytest.mark.parametrize("method", ["assess_user_state", "flow_state_detection", "calculate_engagement_level"])
+def test_incomplete_metrics_dict_raises_value_error(adjuster, method):
+    with pytest.raises(ValueError, match="fixation_duration"):
+        getattr(adjuster, method)({"velocity": 0.5})
+    assert adjuster.difficulty_level == dda.DifficultyLevel.MEDIUM
+
+
+@pytest.mark.parametrize("flow_state", [-1, 3, 1.5])
+def test_adjust_difficulty_rejects_unknown_flow_states(adjuster, flow_state):
+    adjuster.adjust_difficulty(dda.FlowState.FLOW)
+    assert adjuster.adjust_difficulty(flow_state) == dda.DifficultyLevel.HARD
+    assert adjuster.difficulty_level == dda.DifficultyLevel.HARD
+
+
+def test_adjust_difficulty_accepts_flow_state_values(adjuster):
+    for flow_state, difficulty in zip(dda.FlowState, dda._FLOW_TO_DIFFICULTY):
+        assert adjuster.adjust_difficulty(int(flow_state)) == difficulty
@@ -0,0 +1,65 @@
+from collections import deque
+
+import numpy as np
+import pytest
+
+
+class FakeSRanipalEye:
+    """Replays scripted samples through the SRanipal per-sample getters"""
+    def __init__(self, samples=()):
+        self.samples = iter(samples)
+        self.current = None
+
+    def get_gaze_position(self):
+        self.current = next(self.samples)
+        return self.current[0], self.current[1]
+
+    def get_pupil_size(self):
+        return self.current[2]
+
+    def get_velocity(self):
+        return self.current[3]
+
+
+@pytest.fixture
+def etm(load_module):
+    return load_module("eye_tracking_manager", {"sranipal_api": {"SRanipalEye": FakeSRanipalEye}})
+
+
+def make_samples(n):
+    return [(float(i), -float(i), 3.0 + 0.01 * i, 0.5 * i) for i in range(n)]
+
+
+class ScriptedTracker:
+    def __init__(self, etm, samples):
+        self.etm = etm
+        self.samples = iter(samples)
+
+    def calibrate(self):
+        pass
+
+    def acquire_data(self):
+        x, y, pupil, velocity = next(self.samples)
+        return self.etm.EyeTrackingData((x, y), pupil, velocity)
+
+
+@pytest.mark.parametrize("n", [0, 1, 37, 100, 250])
+def test_ring_buffer_matches_bounded_deque(etm, n):
+    samples = make_samples(n)
+    manager = etm.EyeTrackingManager(ScriptedTracker(etm, samples))
+    for _ in range(n):
+        manager.acquire_real_time_data()
+    window = list(deque(samples, maxlen=etm.BUFFER_SIZE))
+    expected = np.array(window).reshape(-1, 4).T
+    for column, values in zip(manager.get_buffer(), expected):
+        np.testing.assert_array_equal(column, values)
+
+
+def test_bulk_batch_matches_per_sample_batch(etm):
+    samples = make_samples(20)
+    tracker = etm.SRanipalEyeTracker()
+    tracker.eye_tracker = FakeSRanipalEye(samples)
+    per_sample = tracker.acquire_batch(len(samples))
+    tracker.eye_tracker.get_eye_data_list = lambda n: samples[:n]
+    for bulk, expected in zip(tracker.acquire_batch(len(samples)), per_sample):
+        np.testing.assert_array_equal(bulk, expected)
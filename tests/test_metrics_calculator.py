@@ -0,0 +1,67 @@
+import numpy as np
+import pytest
+
+import metrics_calculator as mc
+
+
+def make_data(seed, n=500):
+    rng = np.random.default_rng(seed)
+    return mc.EyeTrackingData(rng.random(n), rng.random(n), np.cumsum(rng.uniform(0.005, 0.02, n)))
+
+
+def separate_metrics(calculator, data):
+    """The three single-metric methods, which the fused pass replaces"""
+    return mc.Metrics(calculator.calculate_fixation_duration(data),
+                      calculator.measure_saccade_velocity(data),
+                      calculator.compute_dwell_time(data))
+
+
+def assert_metrics_equal(actual, expected):
+    np.testing.assert_allclose([actual.fixation_duration, actual.saccade_velocity, actual.dwell_time],
+                               [expected.fixation_duration, expected.saccade_velocity, expected.dwell_time],
+                               rtol=1e-6)
+
+
+@pytest.mark.parametrize("data", [make_data(0), mc.EyeTrackingData([1, 2, 4], [4, 5, 5], [0, 1, 3])],
+                         ids=["random", "integer"])
+def test_fused_metrics_match_separate_metrics_with_and_without_numba(data, monkeypatch):
+    calculator = mc.MetricsCalculator()
+    expected = separate_metrics(calculator, data)
+    assert_metrics_equal(calculator.calculate_metrics(data), expected)
+    monkeypatch.setattr(mc, "NUMBA_AVAILABLE", False)
+    assert_metrics_equal(calculator.calculate_metrics(data), expected)
+
+
+def test_repeated_timestamp_gives_the_same_result_with_and_without_numba(monkeypatch):
+    # A moving repeated sample divides by zero (inf); a still one is 0/0 (nan)
+    calculator = mc.MetricsCalculator()
+    for x in ([0.0, 1.0, 2.0], [0.0, 0.0, 1.0]):
+        data = mc.EyeTrackingData(x, [0.0, 0.0, 0.0], [0.0, 0.0, 0.1])
+        jit = calculator.calculate_metrics(data)
+        monkeypatch.setattr(mc, "NUMBA_AVAILABLE", False)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            fallback = calculator.calculate_metrics(data)
+        monkeypatch.setattr(mc, "NUMBA_AVAILABLE", True)
+        np.testing.assert_array_equal([jit.fixation_duration, jit.saccade_velocity, jit.dwell_time],
+                                      [fallback.fixation_duration, fallback.saccade_velocity, fallback.dwell_time])
+
+
+def test_mismatched_lengths_are_rejected(monkeypatch):
+    calculator = mc.MetricsCalculator()
+    data = mc.EyeTrackingData([0.0, 1.0, 2.0], [0.0, 1.0], [0.0, 0.1, 0.2])
+    assert calculator.calculate_metrics(data) == mc.Metrics(0.0, 0.0, 0.0)
+    monkeypatch.setattr(mc, "NUMBA_AVAILABLE", False)
+    assert calculator.calculate_metrics(data) == mc.Metrics(0.0, 0.0, 0.0)
+
+
+@pytest.mark.filterwarnings("ignore::RuntimeWarning")
+@pytest.mark.parametrize("n", [0, 1])
+def test_short_input_matches_the_baseline_loops(monkeypatch, n):
+    # The baseline averaged and summed empty gap lists: nan, nan and 0.0
+    calculator = mc.MetricsCalculator()
+    data = mc.EyeTrackingData(np.zeros(n), np.zeros(n), np.arange(n, dtype=float))
+    expected = mc.Metrics(np.nan, np.nan, 0.0)
+    assert_metrics_equal(separate_metrics(calculator, data), expected)
+    assert_metrics_equal(calculator.calculate_metrics(data), expected)
+    monkeypatch.setattr(mc, "NUMBA_AVAILABLE", False)
+    assert_metrics_equal(calculator.calculate_metrics(data), expected)
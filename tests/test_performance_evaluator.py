@@ -0,0 +1,102 @@
+from concurrent.futures import ThreadPoolExecutor
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+import metrics_calculator as mc
+import performance_evaluator as pe
+
+
+def make_data(seed, n=500):
+    rng = np.random.default_rng(seed)
+    return pe.EyeTrackingData(rng.random(n), rng.random(n), np.cumsum(rng.uniform(0.005, 0.02, n)))
+
+
+def reference_velocity(data):
+    x = data.x.astype(np.float64)
+    y = data.y.astype(np.float64)
+    return np.hypot(np.diff(x), np.diff(y)) / np.diff(data.timestamp)
+
+
+def test_velocity_matches_reference_with_and_without_numexpr(monkeypatch):
+    data = make_data(0)
+    expected = reference_velocity(data)
+    np.testing.assert_allclose(pe.PerformanceEvaluator(pe.Configuration).calculate_velocity(data), expected, rtol=1e-6)
+    monkeypatch.setattr(pe, "ne", None)
+    np.testing.assert_allclose(pe.PerformanceEvaluator(pe.Configuration).calculate_velocity(data), expected, rtol=1e-6)
+
+
+def test_incremental_velocity_matches_batch():
+    data = make_data(1, n=2)
+    evaluator = pe.PerformanceEvaluator(pe.Configuration)
+    x, y, t = data.x, data.y, data.timestamp
+    assert evaluator.incremental_velocity(x[0], y[0], t[0], x[1], y[1], t[1]) == pytest.approx(reference_velocity(data)[0], rel=1e-6)
+
+
+def test_memoized_velocity_is_read_only():
+    evaluator = pe.PerformanceEvaluator(pe.Configuration)
+    velocity = evaluator.calculate_velocity(make_data(2))
+    with pytest.raises(ValueError):
+        velocity[0] = 0.0
+
+
+def test_shared_evaluator_across_threads():
+    evaluator = pe.PerformanceEvaluator(pe.Configuration)
+    datasets = [make_data(seed, n=50 + 40 * seed) for seed in range(16)]
+
+    def velocity(data):
+        return evaluator.calculate_velocity(data).copy()
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        for _ in range(20):
+            for data in datasets:
+                data.mark_updated()
+            for data, result in zip(datasets, pool.map(velocity, datasets)):
+                np.testing.assert_allclose(result, reference_velocity(data), rtol=1e-6)
+
+
+def reference_scores(x, y, timestamp):
+    """The baseline attention and cognitive-load formulas on plain lists"""
+    velocity = np.sqrt(np.diff(x) ** 2 + np.diff(y) ** 2) / np.diff(timestamp)
+    attention = np.mean([1 if v > pe.Configuration.VELOCITY_THRESHOLD else 0 for v in velocity])
+    thr = pe.Configuration.FLOW_THEORY_THRESHOLD
+    cognitive_load = (np.mean(x) / thr) * (1 - np.mean(y) / thr)
+    return attention, cognitive_load
+
+
+def test_foreign_data_objects_match_the_baseline():
+    data = mc.EyeTrackingData([0.1, 0.5, 0.55, 0.9, 1.0], [0.2, 0.1, 0.4, 0.45, 0.3], [0.0, 0.5, 1.0, 1.5, 2.5])
+    evaluator = pe.PerformanceEvaluator(pe.Configuration)
+    attention, cognitive_load = reference_scores(data.x.tolist(), data.y.tolist(), data.timestamp.tolist())
+    assert evaluator.evaluate_attention(data) == pytest.approx(attention)
+    assert evaluator.assess_cognitive_load(data) == pytest.approx(cognitive_load, rel=1e-6)
+
+
+class PlainData:
+    """Hashable and weak-referenceable, but without a version counter"""
+    def __init__(self, x, y, timestamp):
+        self.x, self.y, self.timestamp = x, y, timestamp
+
+
+@pytest.mark.parametrize("make", [PlainData, lambda x, y, t: SimpleNamespace(x=x, y=y, timestamp=t)],
+                         ids=["plain", "namespace"])
+def test_unversioned_data_is_not_memoized(make):
+    x, y, timestamp = [0.1, 0.5, 0.55, 0.9], [0.2, 0.1, 0.4, 0.45], [0.0, 0.5, 1.0, 1.5]
+    data = make(x, y, timestamp)
+    evaluator = pe.PerformanceEvaluator(pe.Configuration)
+    attention, cognitive_load = reference_scores(x, y, timestamp)
+    assert evaluator.evaluate_attention(data) == pytest.approx(attention)
+    assert evaluator.assess_cognitive_load(data) == pytest.approx(cognitive_load, rel=1e-6)
+    # In-place changes are picked up, since nothing was cached for the old contents
+    data.x = [0.3, 0.3, 0.3, 0.3]
+    attention, cognitive_load = reference_scores(data.x, y, timestamp)
+    assert evaluator.evaluate_attention(data) == pytest.approx(attention)
+    assert evaluator.apply_flow_theory(evaluator.calculate_pupillometry_metrics(data)) == pytest.approx(cognitive_load, rel=1e-6)
+
+
+def test_incremental_velocity_handles_nan_like_python():
+    evaluator = pe.PerformanceEvaluator(pe.Configuration)
+    python_velocity = getattr(pe._sample_velocity, "py_func", pe._sample_velocity)
+    for args in [(np.nan, 0.0, 0.0, 1.0, 1.0, 1.0), (0.0, 0.0, 0.0, 1.0, np.inf, 1.0), (0.0, 0.0, 0.0, 3.0, 4.0, 0.5)]:
+        np.testing.assert_array_equal(evaluator.incremental_velocity(*args), python_velocity(*args))
@@ -0,0 +1,68 @@
+import json
+import os
+
+import numpy as np
+import pytest
+
+import pupillometry_analyzer as pa
+
+
+@pytest.fixture
+def pupil_file(tmp_path):
+    path = tmp_path / "pupil_data.json"
+    path.write_text(json.dumps([{"timestamp": 0.01 * i, "diameter": 3.0 + 0.1 * np.sin(i / 10)} for i in range(500)]))
+    return str(path)
+
+
+def test_load_without_cache_writes_nothing(pupil_file, tmp_path):
+    series = pa.load_pupil_data(pupil_file)
+    assert len(series) == 500
+    assert sorted(os.listdir(tmp_path)) == ["pupil_data.json"]
+
+
+def test_load_parses_the_same_with_and_without_orjson(pupil_file, monkeypatch):
+    series = pa.load_pupil_data(pupil_file)
+    monkeypatch.setattr(pa, "orjson", None)
+    fallback = pa.load_pupil_data(pupil_file)
+    np.testing.assert_array_equal(series.timestamps, fallback.timestamps)
+    np.testing.assert_array_equal(series.diameters, fallback.diameters)
+
+
+def test_cache_is_reused_and_invalidated_when_the_source_changes(pupil_file):
+    first = pa.load_pupil_data(pupil_file, cache=True)
+    assert os.path.exists(pupil_file + pa.PUPIL_CACHE_SUFFIX)
+    cached = pa.load_pupil_data(pupil_file, cache=True)
+    np.testing.assert_array_equal(first.diameters, cached.diameters)
+
+    with open(pupil_file, "w") as f:
+        json.dump([{"timestamp": 0.0, "diameter": 4.0}, {"timestamp": 0.01, "diameter": 5.0}], f)
+    assert pa.load_pupil_data(pupil_file, cache=True).diameters.tolist() == [4.0, 5.0]
+
+
+def test_malformed_cache_is_ignored(pupil_file):
+    with open(pupil_file + pa.PUPIL_CACHE_SUFFIX, "wb") as f:
+        f.write(b"not a cache")
+    assert len(pa.load_pupil_data(pupil_file, cache=True)) == 500
+
+
+def make_series(seed, n=400, rate=100.0):
+    rng = np.random.default_rng(seed)
+    return pa.PupilSeries(np.arange(n) / rate, 3.0 + rng.normal(scale=0.05, size=n))
+
+
+def test_default_filter_is_butterworth(tmp_path):
+    analyzer = pa.PupillometryAnalyzer(str(tmp_path / "missing.json"))
+    assert analyzer.config["filter_method"] == "butter"
+    series = make_series(0)
+    rate = (len(series) - 1) / (series.timestamps[-1] - series.timestamps[0])
+    sos = pa.signal.butter(analyzer.config["filter_order"], analyzer.config["filter_cutoff"] / (0.5 * rate), btype="low", output="sos")
+    np.testing.assert_allclose(analyzer.filter_data(series).diameters, pa.signal.sosfiltfilt(sos, series.diameters))
+
+
+def test_batch_matches_per_trial_analysis(tmp_path, monkeypatch):
+    analyzer = pa.PupillometryAnalyzer(str(tmp_path / "missing.json"))
+    trials = [make_series(seed) for seed in range(4)] + [pa.PupilSeries(np.empty(0), np.empty(0))]
+    expected = [analyzer.analyze_pupil_dilation(series) if len(series) else 0.0 for series in trials]
+    assert analyzer.analyze_batch(trials) == pytest.approx(expected)
+    monkeypatch.setattr(pa, "Parallel", None)
+    assert analyzer.analyze_batch(trials) == pytest.approx(expected)
@@ -0,0 +1,67 @@
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+# The detector imports its config/exceptions/models/utils from a package layout
+# that is not part of this tree; the module defines its own classes afterwards
+FAKES = {
+    "saccade_fixation_detector.config": {"Config": object},
+    "saccade_fixation_detector.exceptions": {"InvalidInputError": Exception, "ConfigurationError": Exception},
+    "saccade_fixation_detector.models": {"Saccade": object, "Fixation": object},
+    "saccade_fixation_detector.utils": {"calculate_mean": None, "calculate_std": None},
+}
+
+
+@pytest.fixture
+def sfd(load_module):
+    return load_module("saccade_fixation_detector", FAKES)
+
+
+def make_config(**overrides):
+    config = dict(sample_rate=100.0, low_pass_filter_coefficient=0.5, saccade_threshold=30.0, fixation_threshold=10.0)
+    config.update(overrides)
+    return SimpleNamespace(**config)
+
+
+def bounds(result):
+    return {kind: [(event.start, event.end) for event in events] for kind, events in result.items()}
+
+
+def split_path(sfd, monkeypatch, detector, positions):
+    with monkeypatch.context() as m:
+        m.setattr(sfd, "NUMBA_AVAILABLE", False)
+        return detector.process_eye_positions(positions)
+
+
+@pytest.mark.parametrize("positions", [[], [[1.0, 2.0]]])
+def test_short_input_detects_nothing(sfd, monkeypatch, positions):
+    detector = sfd.SaccadeFixationDetector(make_config())
+    assert bounds(detector.process_eye_positions(positions)) == {"saccades": [], "fixations": []}
+    assert bounds(split_path(sfd, monkeypatch, detector, positions)) == {"saccades": [], "fixations": []}
+    assert detector.calculate_angular_velocity(positions).shape == (0,)
+
+
+def test_fused_path_matches_split_path(sfd, monkeypatch):
+    pytest.importorskip("numba")
+    rng = np.random.default_rng(0)
+    for _ in range(200):
+        positions = np.cumsum(rng.normal(scale=0.2, size=(int(rng.integers(2, 60)), 2)), axis=0)
+        detector = sfd.SaccadeFixationDetector(make_config(
+            low_pass_filter_coefficient=float(rng.choice([0.0, 0.5, -0.3])),
+            saccade_threshold=float(rng.uniform(0, 40)), fixation_threshold=float(rng.uniform(0, 40))))
+        fused = detector.process_eye_positions(positions)
+        split = split_path(sfd, monkeypatch, detector, positions)
+        assert bounds(fused) == bounds(split)
+        for kind in fused:
+            for a, b in zip(fused[kind], split[kind]):
+                np.testing.assert_allclose(a.velocities, b.velocities, rtol=1e-5, atol=1e-4)
+
+
+def test_fused_path_matches_split_path_with_nan_samples(sfd, monkeypatch):
+    pytest.importorskip("numba")
+    positions = np.array([[0.0, 0.0], [0.01, 0.0], [0.02, 0.0], [np.nan, np.nan], [np.nan, np.nan],
+                          [0.03, 0.0], [0.04, 0.0], [0.05, 0.0]])
+    for coefficient in (0.0, 0.5):
+        detector = sfd.SaccadeFixationDetector(make_config(low_pass_filter_coefficient=coefficient))
+        assert bounds(detector.process_eye_positions(positions)) == bounds(split_path(sfd, monkeypatch, detector, positions))
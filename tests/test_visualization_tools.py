@@ -0,0 +1,117 @@
+from collections import deque
+
+import matplotlib
+matplotlib.use("Agg")
+
+import numpy as np
+import pytest
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+from scipy.stats import linregress
+
+import visualization_tools as vt
+
+
+class FakeWidget:
+    """Stands in for the Tk root, frame and canvas so the real __init__ runs without a display"""
+    def __init__(self, *args, **kwargs):
+        pass
+
+    def __getattr__(self, name):
+        return lambda *args, **kwargs: None
+
+
+@pytest.fixture(params=[False, True], ids=["draw_idle", "blit"])
+def tools(request, monkeypatch, tmp_path):
+    monkeypatch.setattr(vt.tk, "Tk", FakeWidget)
+    monkeypatch.setattr(vt.tk, "Frame", FakeWidget)
+    monkeypatch.setattr(vt.tk, "Canvas", FakeWidget)
+    if request.param:
+        def agg_figure(*args, **kwargs):
+            figure = Figure(*args, **kwargs)
+            FigureCanvasAgg(figure)
+            return figure
+        monkeypatch.setattr(vt.plt, "Figure", agg_figure)
+    tools = vt.VisualizationTools(str(tmp_path / "missing.json"))
+    assert tools._blitting == request.param
+    return tools
+
+
+def test_ring_buffer_matches_list_window(tools):
+    window = deque(maxlen=tools.gaze_pattern_window_size)
+    for i in range(int(2.5 * tools.gaze_pattern_window_size)):
+        sample = vt.EyeTrackingData(float(i), float(i % 17), float(-i), 3.0 + 0.01 * i)
+        tools.add_eye_data(sample)
+        window.append(sample)
+        if i % 37 == 0:
+            np.testing.assert_allclose(tools._window(), [[s.x_gaze, s.y_gaze] for s in window])
+            assert tools.get_pupil_diameter() == pytest.approx(sample.pupil_diameter, rel=1e-6)
+            assert [s.timestamp for s in tools.eye_data] == [s.timestamp for s in window]
+
+
+def test_get_saccade_data_returns_every_crossing(tools):
+    x = np.array([0, 1, 20, 21, 21, 0, 0, 0], dtype=np.float32)
+    y = np.array([0, 0, 0, 0, 15, 15, 15, 30], dtype=np.float32)
+    expected = [(i - 1, i) for i in range(1, len(x))
+                if abs(x[i] - x[i - 1]) > tools.saccade_threshold or abs(y[i] - y[i - 1]) > tools.saccade_threshold]
+    saccades = tools.get_saccade_data(x, y)
+    assert saccades["start_x"].tolist() == [x[s] for s, _ in expected]
+    assert saccades["end_y"].tolist() == [y[e] for _, e in expected]
+
+
+def test_get_gaze_angle_matches_linregress(tools):
+    rng = np.random.default_rng(0)
+    x = rng.normal(size=100).astype(np.float32)
+    y = (0.7 * x + rng.normal(scale=0.1, size=100)).astype(np.float32)
+    assert tools.get_gaze_angle(x, y) == pytest.approx(np.degrees(np.arctan(linregress(x, y).slope)))
+    assert tools.get_gaze_angle(np.ones(5), np.arange(5.0)) == 0
+
+
+def test_add_eye_data_defers_rendering_to_the_plot_tick(tools, monkeypatch):
+    renders = []
+    monkeypatch.setattr(tools, "plot_gaze_patterns", lambda: renders.append(tools._count))
+    tools.update_plot()
+    for i in range(5):
+        tools.add_eye_data(vt.EyeTrackingData(float(i), float(i), float(i), 3.0))
+    assert renders == []
+    tools.update_plot()
+    tools.update_plot()
+    assert renders == [5]
+
+
+@pytest.mark.parametrize("mode", list(vt.VisualizationMode))
+def test_mode_switch_hides_unused_artists_and_rerenders(tools, mode):
+    for i in range(20):
+        tools.add_eye_data(vt.EyeTrackingData(float(i), 15.0 * i, 0.0, 3.0))
+    tools.mode = vt.VisualizationMode.METRICS
+    tools.update_plot()
+    tools.mode = mode
+    assert tools._dirty
+    tools.update_plot()
+    shown = set(tools._mode_artists())
+    for artist in (tools._line, tools._scatter, tools._saccades, tools._angle_text, tools._pupil_text):
+        assert artist.get_visible() == (artist in shown)
+
+
+def test_full_redraw_keeps_the_trace_visible(tools):
+    if not tools._blitting:
+        pytest.skip("only blitting canvases skip animated artists on a full redraw")
+    for i in range(20):
+        tools.add_eye_data(vt.EyeTrackingData(float(i), float(i), 0.0, 3.0))
+    tools.update_plot()
+    # A resize or expose triggers a full draw with no new samples
+    tools.plot.canvas.draw()
+    assert not tools._dirty
+    rgb = np.asarray(tools.plot.canvas.buffer_rgba())[..., :3].astype(int)
+    # The axes are black on white; only the blue trace and red samples are coloured
+    assert ((rgb[..., 0] != rgb[..., 1]) | (rgb[..., 1] != rgb[..., 2])).any()
+
+
+def test_get_pupil_diameter_accepts_an_explicit_sample_list(tools):
+    samples = [vt.EyeTrackingData(0.0, 0.0, 0.0, 3.0), vt.EyeTrackingData(1.0, 0.0, 0.0, 4.5)]
+    assert tools.get_pupil_diameter(samples) == 4.5
+    assert tools.get_pupil_diameter([]) == 0
+    assert tools.get_pupil_diameter() == 0
+    for sample in samples:
+        tools.add_eye_data(sample)
+    assert tools.get_pupil_diameter(tools.eye_data) == tools.get_pupil_diameter() == 4.5
@@ -0,0 +1,112 @@
+import threading
+import time
+
+import pytest
+
+
+class EyeTrackingDataException(Exception):
+    pass
+
+
+class UnityCommunicationException(Exception):
+    pass
+
+
+class FakeUnityAPI:
+    """Records sent payloads; send_data fails while fail is set and blocks while gate is clear"""
+    def __init__(self):
+        self.sent = []
+        self.fail = False
+        self.gate = threading.Event()
+        self.gate.set()
+
+    def connect(self):
+        pass
+
+    def disconnect(self):
+        pass
+
+    def send_data(self, payload):
+        self.gate.wait()
+        if self.fail:
+            raise ConnectionError("link down")
+        self.sent.append(payload)
+
+
+@pytest.fixture
+def xr(load_module):
+    return load_module("xr_integration_module", {
+        "unity_api": {"UnityAPI": FakeUnityAPI},
+        "xr_eye_tracking_performance_framework.config": {"Config": object},
+        "xr_eye_tracking_performance_framework.exceptions": {
+            "EyeTrackingDataException": EyeTrackingDataException,
+            "UnityCommunicationException": UnityCommunicationException,
+        },
+        "xr_eye_tracking_performance_framework.models": {"EyeTrackingData": object},
+    })
+
+
+@pytest.fixture
+def integration(xr):
+    return xr.XREyeTrackingIntegration(xr.Config("http://localhost:8080", 1000))
+
+
+def test_samples_are_sent_as_packed_batches(xr, integration):
+    integration.unity_api.gate.clear()
+    for i in range(100):
+        integration.send_eye_data(xr.EyeTrackingData(float(i), 1.0, 2.0))
+    integration.unity_api.gate.set()
+    integration.close_connection()
+    payload = b"".join(integration.unity_api.sent)
+    assert all(len(batch) <= xr.TX_BATCH_SIZE * xr.EYE_DATA_STRUCT.size for batch in integration.unity_api.sent)
+    assert [record[0] for record in xr.EYE_DATA_STRUCT.iter_unpack(payload)] == [float(i) for i in range(100)]
+
+
+def test_send_failure_is_raised_on_next_send(xr, integration):
+    integration.unity_api.fail = True
+    integration.send_eye_data(xr.EyeTrackingData(1.0, 1.0, 1.0))
+    deadline = time.monotonic() + 5
+    while integration._tx_errors.empty() and time.monotonic() < deadline:
+        time.sleep(0.001)
+    with pytest.raises(EyeTrackingDataException):
+        integration.send_eye_data(xr.EyeTrackingData(2.0, 2.0, 2.0))
+    integration.unity_api.fail = False
+    integration.close_connection()
+
+
+def test_send_failure_is_raised_on_close(xr, integration):
+    integration.unity_api.fail = True
+    integration.send_eye_data(xr.EyeTrackingData(1.0, 1.0, 1.0))
+    with pytest.raises(EyeTrackingDataException):
+        integration.close_connection()
+
+
+def test_send_after_close_is_rejected(xr, integration):
+    integration.close_connection()
+    with pytest.raises(EyeTrackingDataException):
+        integration.send_eye_data(xr.EyeTrackingData(1.0, 1.0, 1.0))
+
+
+def test_every_failed_batch_is_counted_in_one_error(xr, integration):
+    # Hold the transmit thread in its first send so the samples split over several batches
+    integration.unity_api.gate.clear()
+    integration.unity_api.fail = True
+    for i in range(3 * xr.TX_BATCH_SIZE):
+        integration.send_eye_data(xr.EyeTrackingData(float(i), 1.0, 2.0))
+    integration.unity_api.gate.set()
+    with pytest.raises(EyeTrackingDataException, match=f"Failed to send {3 * xr.TX_BATCH_SIZE} eye tracking samples"):
+        integration.close_connection()
+    assert integration.unity_api.sent == []
+    # Reported once
+    integration.close_connection()
+
+
+def test_samples_behind_the_stop_sentinel_are_counted(xr, integration):
+    integration.unity_api.gate.clear()
+    integration.send_eye_data(xr.EyeTrackingData(0.0, 1.0, 2.0))
+    # A send racing close_connection lands behind the sentinel
+    integration._tx_q.put(xr._STOP)
+    integration._tx_q.put(xr.EYE_DATA_STRUCT.pack(1.0, 1.0, 2.0))
+    integration.unity_api.gate.set()
+    with pytest.raises(EyeTrackingDataException, match="Failed to send 1 eye tracking samples"):
+        integration.close_connection()
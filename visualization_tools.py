@@ -6,11 +6,10 @@ from tkinter import ttk
 import logging
 import json
 import os
-from typing import Dict, List, Tuple
+from typing import Dict, List, Optional, Tuple
 from dataclasses import dataclass
 from enum import Enum
 from scipy.signal import savgol_filter
-from scipy.stats import linregress
 
 # Set up logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
@@ -24,7 +23,7 @@ DEFAULT_CONFIG = {
     'metric_update_interval': 1000  # milliseconds
 }
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class EyeTrackingData:
     """Represents eye tracking data"""
     timestamp: float
@@ -43,15 +42,20 @@ class VisualizationTools:
     def __init__(self, config_file: str = CONFIG_FILE):
         self.config_file = config_file
         self.config = self.load_config()
-        self.eye_data = []
-        self.gaze_pattern_window = []
         self.saccade_data = []
         self.metrics = {}
         self.plot_interval = self.config['plot_interval']
         self.saccade_threshold = self.config['saccade_threshold']
         self.gaze_pattern_window_size = self.config['gaze_pattern_window']
         self.metric_update_interval = self.config['metric_update_interval']
-        self.mode = VisualizationMode.GAZE_PATTERN
+        # Ring buffer of the most recent gaze_pattern_window samples (SoA, float32:
+        # ample precision for screen-space gaze and half the footprint of float64)
+        self._xy = np.empty((self.gaze_pattern_window_size, 2), dtype=np.float32)
+        self._pupil = np.empty(self.gaze_pattern_window_size, dtype=np.float32)
+        self._timestamp = np.empty(self.gaze_pattern_window_size)
+        self._idx = 0
+        self._count = 0
+        self._dirty = True
         self.root = tk.Tk()
         self.root.title('Eye Tracking Visualization')
         self.plot_frame = tk.Frame(self.root)
@@ -61,11 +65,22 @@ class VisualizationTools:
         self.ax.set_xlim(-100, 100)
         self.ax.set_ylim(-100, 100)
         self.ax.set_aspect('equal')
+        # Artists are created once and updated in place; when the canvas
+        # supports blitting they are drawn over a cached background
+        self._blitting = self.plot.canvas.supports_blit
+        self._background = None
+        self._line, = self.ax.plot([], [], 'b-', animated=self._blitting)
+        self._scatter = self.ax.scatter([], [], c='r', animated=self._blitting)
+        self._saccades = self.ax.scatter([], [], c='g', animated=self._blitting)
+        self._angle_text = self.ax.text(0.05, 0.9, '', transform=self.ax.transAxes, animated=self._blitting)
+        self._pupil_text = self.ax.text(0.05, 0.8, '', transform=self.ax.transAxes, animated=self._blitting)
+        if self._blitting:
+            self.plot.canvas.mpl_connect('draw_event', self._on_draw)
+        self.mode = VisualizationMode.GAZE_PATTERN
         self.plot_canvas = tk.Canvas(self.root, width=800, height=600)
         self.plot_canvas.pack(fill='both', expand=True)
         self.plot_id = self.plot_canvas.create_window((0, 0), window=self.plot, anchor='nw')
         self.update_plot()
-        self.root.after(self.plot_interval, self.update_plot)
         self.root.after(self.metric_update_interval, self.update_metrics)
         self.root.mainloop()
 
@@ -77,101 +92,158 @@ class VisualizationTools:
         else:
             return DEFAULT_CONFIG
 
+    def _unwrap(self, column: np.ndarray) -> np.ndarray:
+        """Returns a ring buffer column in oldest-to-newest order"""
+        if self._count < self.gaze_pattern_window_size:
+            return column[:self._count]
+        return np.concatenate((column[self._idx:], column[:self._idx]))
+
+    def _window(self) -> np.ndarray:
+        """Returns the buffered (x, y) gaze samples, oldest first"""
+        return self._unwrap(self._xy)
+
+    @property
+    def eye_data(self) -> List[EyeTrackingData]:
+        """The buffered samples, oldest first, rebuilt from the ring buffer; a snapshot, so use add_eye_data to add samples"""
+        return [EyeTrackingData(float(t), float(x), float(y), float(p)) for t, (x, y), p in
+                zip(self._unwrap(self._timestamp), self._window(), self._unwrap(self._pupil))]
+
+    @property
+    def mode(self) -> VisualizationMode:
+        """The active visualization mode"""
+        return self._mode
+
+    @mode.setter
+    def mode(self, mode: VisualizationMode):
+        """Switches mode, hiding the artists the new mode doesn't draw and forcing a render"""
+        self._mode = mode
+        shown = self._mode_artists()
+        for artist in (self._line, self._scatter, self._saccades, self._angle_text, self._pupil_text):
+            artist.set_visible(artist in shown)
+        self._dirty = True
+
+    def _mode_artists(self) -> Tuple:
+        """Returns the artists drawn in the current mode"""
+        if self._mode == VisualizationMode.SACCADE:
+            return self._line, self._scatter, self._saccades
+        if self._mode == VisualizationMode.METRICS:
+            return self._line, self._scatter, self._angle_text, self._pupil_text
+        return self._line, self._scatter
+
+    def _on_draw(self, event):
+        """Caches the static background after every full redraw and redraws the animated artists over it"""
+        self._background = self.plot.canvas.copy_from_bbox(self.ax.bbox)
+        # A full redraw (resize, expose) skips animated artists; draw them again so
+        # the trace doesn't vanish until the next sample arrives
+        for artist in self._mode_artists():
+            self.ax.draw_artist(artist)
+
+    def _blit(self, *artists):
+        """Redraws only the given artists over the cached background"""
+        canvas = self.plot.canvas
+        if not self._blitting:
+            canvas.draw_idle()
+            return
+        if self._background is None:
+            canvas.draw()
+        canvas.restore_region(self._background)
+        for artist in artists:
+            self.ax.draw_artist(artist)
+        canvas.blit(self.ax.bbox)
+
     def update_plot(self):
         """Updates the plot with the latest eye tracking data"""
-        if self.mode == VisualizationMode.GAZE_PATTERN:
-            self.plot_gaze_patterns()
-        elif self.mode == VisualizationMode.SACCADE:
-            self.visualize_saccades()
-        elif self.mode == VisualizationMode.METRICS:
-            self.display_metrics()
-        self.plot_canvas.itemconfig(self.plot_id, window=self.plot)
+        # One render per tick covers every sample added since the last one
+        if self._dirty:
+            self._dirty = False
+            if self.mode == VisualizationMode.GAZE_PATTERN:
+                self.plot_gaze_patterns()
+            elif self.mode == VisualizationMode.SACCADE:
+                self.visualize_saccades()
+            elif self.mode == VisualizationMode.METRICS:
+                self.display_metrics()
         self.root.after(self.plot_interval, self.update_plot)
 
     def plot_gaze_patterns(self):
         """Plots the gaze patterns"""
-        self.ax.clear()
-        self.ax.set_xlim(-100, 100)
-        self.ax.set_ylim(-100, 100)
-        self.ax.set_aspect('equal')
-        if len(self.eye_data) > 0:
-            x_gaze = [data.x_gaze for data in self.eye_data]
-            y_gaze = [data.y_gaze for data in self.eye_data]
-            self.ax.plot(x_gaze, y_gaze, 'b-')
-            self.ax.scatter(x_gaze, y_gaze, c='r')
-        self.plot_canvas.itemconfig(self.plot_id, window=self.plot)
+        xy = self._window()
+        self._line.set_data(xy[:, 0], xy[:, 1])
+        self._scatter.set_offsets(xy)
+        self._blit(*self._mode_artists())
 
     def visualize_saccades(self):
         """Visualizes saccades"""
-        self.ax.clear()
-        self.ax.set_xlim(-100, 100)
-        self.ax.set_ylim(-100, 100)
-        self.ax.set_aspect('equal')
-        if len(self.eye_data) > 0:
-            x_gaze = [data.x_gaze for data in self.eye_data]
-            y_gaze = [data.y_gaze for data in self.eye_data]
-            saccade_data = self.get_saccade_data(x_gaze, y_gaze)
-            self.ax.plot(x_gaze, y_gaze, 'b-')
-            self.ax.scatter(x_gaze, y_gaze, c='r')
-            self.ax.scatter(saccade_data['start_x'], saccade_data['start_y'], c='g')
-            self.ax.scatter(saccade_data['end_x'], saccade_data['end_y'], c='g')
-        self.plot_canvas.itemconfig(self.plot_id, window=self.plot)
-
-    def get_saccade_data(self, x_gaze: List[float], y_gaze: List[float]) -> Dict:
-        """Gets saccade data"""
-        saccade_data = {}
-        for i in range(1, len(x_gaze)):
-            if abs(x_gaze[i] - x_gaze[i-1]) > self.saccade_threshold or abs(y_gaze[i] - y_gaze[i-1]) > self.saccade_threshold:
-                saccade_data['start_x'] = x_gaze[i-1]
-                saccade_data['start_y'] = y_gaze[i-1]
-                saccade_data['end_x'] = x_gaze[i]
-                saccade_data['end_y'] = y_gaze[i]
-                break
-        return saccade_data
+        xy = self._window()
+        saccade_data = self.get_saccade_data(xy[:, 0], xy[:, 1])
+        self._line.set_data(xy[:, 0], xy[:, 1])
+        self._scatter.set_offsets(xy)
+        self._saccades.set_offsets(np.column_stack((
+            np.concatenate((saccade_data['start_x'], saccade_data['end_x'])),
+            np.concatenate((saccade_data['start_y'], saccade_data['end_y'])))))
+        self._blit(*self._mode_artists())
+
+    def get_saccade_data(self, x_gaze: np.ndarray, y_gaze: np.ndarray) -> Dict[str, np.ndarray]:
+        """Gets the start and end points of every saccade in the window"""
+        x_gaze = np.asarray(x_gaze)
+        y_gaze = np.asarray(y_gaze)
+        mask = (np.abs(np.diff(x_gaze)) > self.saccade_threshold) | (np.abs(np.diff(y_gaze)) > self.saccade_threshold)
+        idxs = np.flatnonzero(mask)
+        return {
+            'start_x': x_gaze[idxs],
+            'start_y': y_gaze[idxs],
+            'end_x': x_gaze[idxs + 1],
+            'end_y': y_gaze[idxs + 1]
+        }
 
     def display_metrics(self):
         """Displays metrics"""
-        self.ax.clear()
-        self.ax.set_xlim(-100, 100)
-        self.ax.set_ylim(-100, 100)
-        self.ax.set_aspect('equal')
-        if len(self.eye_data) > 0:
-            x_gaze = [data.x_gaze for data in self.eye_data]
-            y_gaze = [data.y_gaze for data in self.eye_data]
-            self.ax.plot(x_gaze, y_gaze, 'b-')
-            self.ax.scatter(x_gaze, y_gaze, c='r')
-            self.ax.text(0.05, 0.9, f'Gaze Angle: {self.get_gaze_angle(x_gaze, y_gaze)}', transform=self.ax.transAxes)
-            self.ax.text(0.05, 0.8, f'Pupil Diameter: {self.get_pupil_diameter(self.eye_data)}', transform=self.ax.transAxes)
-        self.plot_canvas.itemconfig(self.plot_id, window=self.plot)
+        xy = self._window()
+        self._line.set_data(xy[:, 0], xy[:, 1])
+        self._scatter.set_offsets(xy)
+        self._angle_text.set_text(f'Gaze Angle: {self.get_gaze_angle(xy[:, 0], xy[:, 1])}')
+        self._pupil_text.set_text(f'Pupil Diameter: {self.get_pupil_diameter()}')
+        self._blit(*self._mode_artists())
 
     def get_gaze_angle(self, x_gaze: List[float], y_gaze: List[float]) -> float:
         """Gets gaze angle"""
         if len(x_gaze) > 1:
-            slope, intercept, r_value, p_value, std_err = linregress(x_gaze, y_gaze)
-            return np.arctan(slope) * 180 / np.pi
+            x = np.asarray(x_gaze, dtype=np.float64)
+            y = np.asarray(y_gaze, dtype=np.float64)
+            dx = x - x.mean()
+            sxx = np.dot(dx, dx)
+            if sxx == 0:
+                return 0
+            slope = np.dot(dx, y - y.mean()) / sxx
+            return np.degrees(np.arctan(slope))
         else:
             return 0
 
-    def get_pupil_diameter(self, eye_data: List[EyeTrackingData]) -> float:
-        """Gets pupil diameter"""
-        if len(eye_data) > 0:
-            return eye_data[-1].pupil_diameter
+    def get_pupil_diameter(self, eye_data: Optional[List[EyeTrackingData]] = None) -> float:
+        """Gets the most recent pupil diameter from eye_data, or from the buffered samples if it is omitted"""
+        if eye_data is not None:
+            return eye_data[-1].pupil_diameter if len(eye_data) > 0 else 0
+        if self._count > 0:
+            return float(self._pupil[self._idx - 1])
         else:
             return 0
 
     def update_metrics(self):
         """Updates metrics"""
-        if len(self.eye_data) > 0:
-            self.metrics['gaze_angle'] = self.get_gaze_angle([data.x_gaze for data in self.eye_data], [data.y_gaze for data in self.eye_data])
-            self.metrics['pupil_diameter'] = self.get_pupil_diameter(self.eye_data)
+        if self._count > 0:
+            xy = self._window()
+            self.metrics['gaze_angle'] = self.get_gaze_angle(xy[:, 0], xy[:, 1])
+            self.metrics['pupil_diameter'] = self.get_pupil_diameter()
         self.root.after(self.metric_update_interval, self.update_metrics)
 
     def add_eye_data(self, eye_data: EyeTrackingData):
         """Adds eye tracking data"""
-        self.eye_data.append(eye_data)
-        if len(self.eye_data) > self.gaze_pattern_window_size:
-            self.eye_data.pop(0)
-        self.update_plot()
+        idx = self._idx
+        self._xy[idx] = eye_data.x_gaze, eye_data.y_gaze
+        self._pupil[idx] = eye_data.pupil_diameter
+        self._timestamp[idx] = eye_data.timestamp
+        self._idx = (idx + 1) % self.gaze_pattern_window_size
+        self._count = min(self._count + 1, self.gaze_pattern_window_size)
+        self._dirty = True
 
 def main():
     config_file = 'visualization_config.json'
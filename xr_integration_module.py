@@ -1,7 +1,15 @@
 import json
 import logging
+import queue
+import struct
 import threading
-from typing import Dict, List, Tuple
+from typing import Any, Dict, List, Tuple
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 from unity_api import UnityAPI
 from xr_eye_tracking_performance_framework.config import Config
 from xr_eye_tracking_performance_framework.exceptions import (
@@ -14,6 +22,26 @@ from xr_eye_tracking_performance_framework.models import EyeTrackingData
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Wire format of one eye tracking sample: little-endian velocity, fixation, saccade
+EYE_DATA_STRUCT = struct.Struct('<fff')
+# Maximum number of samples coalesced into one send_data call
+TX_BATCH_SIZE = 32
+
+# Sentinel telling the transmit thread to flush and exit
+_STOP = object()
+
+def _loads(raw) -> Any:
+    """Parse JSON from str or bytes, using orjson when it is installed"""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+def _dumps(obj: Any) -> bytes:
+    """Serialize to JSON bytes, using orjson when it is installed"""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj).encode("utf-8")
+
 class XREyeTrackingIntegration:
     """
     Class responsible for Unity XR integration for seamless eye tracking data communication.
@@ -30,7 +58,17 @@ class XREyeTrackingIntegration:
         self.unity_api = UnityAPI()
         self.eye_tracking_data = None
         self.scene_updates = None
+        # Serializes receive_scene_updates; the getters read a single
+        # attribute reference and need no lock
         self.lock = threading.Lock()
+        self._packer = EYE_DATA_STRUCT.pack
+        self._tx_q = queue.SimpleQueue()
+        # (error, dropped sample count) for each failure on the transmit thread; the
+        # caller thread drains and re-raises them, so none is lost to a racing overwrite
+        self._tx_errors = queue.SimpleQueue()
+        self._closed = False
+        self._tx_thread = threading.Thread(target=self._tx_loop, name="XRUnityTx", daemon=True)
+        self._tx_thread.start()
 
     def unity_communication(self) -> None:
         """
@@ -45,20 +83,77 @@ class XREyeTrackingIntegration:
 
     def send_eye_data(self, eye_tracking_data: EyeTrackingData) -> None:
         """
-        Send eye tracking data to the Unity API.
+        Queue eye tracking data for the Unity API as a packed EYE_DATA_STRUCT
+        record (12 bytes: velocity, fixation, saccade as little-endian float32).
+        Records are sent in batches of up to TX_BATCH_SIZE by the transmit thread.
 
         Args:
         - eye_tracking_data (EyeTrackingData): Eye tracking data to be sent.
+
+        Raises:
+        - EyeTrackingDataException: If the connection is closed, if the data cannot be
+          packed, or if an earlier batch failed to send.
         """
+        if self._closed:
+            raise EyeTrackingDataException("Cannot send eye tracking data after the connection is closed")
+        self._raise_tx_error()
         try:
-            with self.lock:
-                self.eye_tracking_data = eye_tracking_data
-                self.unity_api.send_data(json.dumps(eye_tracking_data.to_dict()))
-                logger.info("Sent eye tracking data to Unity API")
+            self._tx_q.put(self._packer(
+                eye_tracking_data.velocity, eye_tracking_data.fixation, eye_tracking_data.saccade))
+            self.eye_tracking_data = eye_tracking_data
         except Exception as e:
             logger.error(f"Failed to send eye tracking data: {str(e)}")
             raise EyeTrackingDataException("Failed to send eye tracking data")
 
+    def _tx_loop(self) -> None:
+        """
+        Drain queued records and send them to the Unity API in batches.
+
+        Failures are handed to the caller thread through _tx_errors, with the number
+        of samples dropped. Records queued behind the stop sentinel (a send racing
+        close_connection) cannot be sent and are reported the same way.
+        """
+        stop = False
+        while not stop:
+            batch = []
+            record = self._tx_q.get()
+            while True:
+                if record is _STOP:
+                    stop = True
+                    break
+                batch.append(record)
+                if len(batch) >= TX_BATCH_SIZE or self._tx_q.empty():
+                    break
+                record = self._tx_q.get()
+            if batch:
+                try:
+                    self.unity_api.send_data(b"".join(batch))
+                    logger.debug(f"Sent {len(batch)} eye tracking samples to Unity API")
+                except Exception as e:
+                    logger.error(f"Failed to send {len(batch)} eye tracking samples: {str(e)}")
+                    self._tx_errors.put((e, len(batch)))
+        dropped = 0
+        while not self._tx_q.empty():
+            if self._tx_q.get() is not _STOP:
+                dropped += 1
+        if dropped:
+            logger.error(f"Dropped {dropped} eye tracking samples queued after close")
+            self._tx_errors.put((EyeTrackingDataException("connection closed"), dropped))
+
+    def _raise_tx_error(self) -> None:
+        """
+        Raise (once) the failures of the transmit thread since the last call, as one
+        exception carrying the total number of dropped samples and the latest error.
+        """
+        error = None
+        dropped = 0
+        while not self._tx_errors.empty():
+            error, count = self._tx_errors.get()
+            dropped += count
+        if error is not None:
+            raise EyeTrackingDataException(
+                f"Failed to send {dropped} eye tracking samples: {str(error)}") from error
+
     def receive_scene_updates(self) -> Dict:
         """
         Receive scene updates from the Unity API.
@@ -70,7 +165,7 @@ class XREyeTrackingIntegration:
             with self.lock:
                 self.scene_updates = self.unity_api.receive_data()
                 logger.info("Received scene updates from Unity API")
-                return json.loads(self.scene_updates)
+                return _loads(self.scene_updates)
         except Exception as e:
             logger.error(f"Failed to receive scene updates: {str(e)}")
             raise UnityCommunicationException("Failed to receive scene updates")
@@ -82,8 +177,7 @@ class XREyeTrackingIntegration:
         Returns:
         - EyeTrackingData: Current eye tracking data.
         """
-        with self.lock:
-            return self.eye_tracking_data
+        return self.eye_tracking_data
 
     def get_scene_updates(self) -> Dict:
         """
@@ -92,19 +186,27 @@ class XREyeTrackingIntegration:
         Returns:
         - Dict: Current scene updates.
         """
-        with self.lock:
-            return self.scene_updates
+        return self.scene_updates
 
     def close_connection(self) -> None:
         """
-        Close the connection to the Unity API.
+        Flush queued eye tracking data and close the connection to the Unity API.
+
+        Raises:
+        - UnityCommunicationException: If disconnecting fails.
+        - EyeTrackingDataException: If a queued batch failed to send.
         """
+        if not self._closed:
+            self._closed = True
+            self._tx_q.put(_STOP)
+            self._tx_thread.join()
         try:
             self.unity_api.disconnect()
             logger.info("Disconnected from Unity API")
         except Exception as e:
             logger.error(f"Failed to disconnect from Unity API: {str(e)}")
             raise UnityCommunicationException("Failed to disconnect from Unity API")
+        self._raise_tx_error()
 
 
 class EyeTrackingData:
@@ -112,6 +214,8 @@ class EyeTrackingData:
     Class representing eye tracking data.
     """
 
+    __slots__ = ("velocity", "fixation", "saccade")
+
     def __init__(self, velocity: float, fixation: float, saccade: float):
         """
         Initialize the EyeTrackingData class.
@@ -134,6 +238,16 @@ class EyeTrackingData:
         """
         return {"velocity": self.velocity, "fixation": self.fixation, "saccade": self.saccade}
 
+    def to_json(self) -> bytes:
+        """
+        Serialize the eye tracking data to JSON, for consumers that cannot read
+        the binary EYE_DATA_STRUCT record.
+
+        Returns:
+        - bytes: Eye tracking data as UTF-8 JSON.
+        """
+        return _dumps({"velocity": self.velocity, "fixation": self.fixation, "saccade": self.saccade})
+
 
 class Config:
     """